@@ -43,6 +43,13 @@ class DatabaseConnection(LoggerMixin):
         self.db_config = config.get_database_config()
         self.db_path = self.db_config.get('archivo', './data/deleginsumos.db')
         self._local = threading.local()
+        # Registro de todas las conexiones thread-local abiertas (para el cierre)
+        self._connections: Dict[int, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
+        # Se incrementa en close_all_connections: cada hilo compara la
+        # generación de su conexión y, si quedó vieja, la cierra él mismo y
+        # reconecta (p. ej. tras restaurar un backup)
+        self._generation = 0
         self._initialized = True
         
         # Crear directorio de base de datos si no existe
@@ -60,17 +67,30 @@ class DatabaseConnection(LoggerMixin):
         Raises:
             DatabaseConnectionException: Si no se puede conectar
         """
-        if not hasattr(self._local, 'connection') or self._local.connection is None:
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None and self._local.generation != self._generation:
+            # Conexión de una generación anterior: la cierra su propio hilo
+            self.close_connection()
+            connection = None
+        
+        if connection is None:
             try:
                 self._local.connection = sqlite3.connect(
                     self.db_path,
                     check_same_thread=False,
-                    timeout=30.0
+                    timeout=30.0,
+                    # Sentencias preparadas reutilizadas por texto SQL
+                    cached_statements=self.db_config.get('sentencias_en_cache', 256)
                 )
                 
+                self._local.generation = self._generation
+                
                 # Configurar conexión
                 self._configure_connection(self._local.connection)
                 
+                with self._connections_lock:
+                    self._connections[threading.get_ident()] = self._local.connection
+                
                 self.logger.debug(f"Nueva conexión creada para thread {threading.current_thread().name}")
                 
             except sqlite3.Error as e:
@@ -354,13 +374,39 @@ class DatabaseConnection(LoggerMixin):
             try:
                 self._local.connection.close()
                 self._local.connection = None
+                with self._connections_lock:
+                    self._connections.pop(threading.get_ident(), None)
                 self.logger.debug("Conexión cerrada")
             except Exception as e:
                 self.logger.error(f"Error cerrando conexión: {e}")
     
-    def close_all_connections(self) -> None:
-        """Cierra todas las conexiones (para shutdown de la app)"""
+    def close_all_connections(self, include_workers: bool = False) -> None:
+        """
+        Cierra la conexión de este hilo e invalida las de los demás.
+        
+        Los otros hilos no pierden su conexión en medio de una operación: en
+        su siguiente uso detectan la nueva generación, la cierran y reconectan.
+        
+        Args:
+            include_workers: Cerrar también ahora las conexiones de los otros
+                hilos (solo en el cierre de la app, con los workers ya detenidos)
+        """
+        with self._connections_lock:
+            self._generation += 1
+        
         self.close_connection()
+        
+        if include_workers:
+            with self._connections_lock:
+                connections = list(self._connections.values())
+                self._connections.clear()
+            
+            for conn in connections:
+                try:
+                    conn.close()
+                except Exception as e:
+                    self.logger.error(f"Error cerrando conexión: {e}")
+        
         self.logger.info("Todas las conexiones cerradas")
 
 
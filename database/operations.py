@@ -3,8 +3,9 @@ DelegInsumos - Operaciones de Base de Datos
 Contiene todas las operaciones CRUD para las entidades del sistema
 """
 
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Tuple
 from datetime import datetime, date
+from functools import lru_cache
 import sqlite3
 import shutil
 import os
@@ -20,6 +21,31 @@ from exceptions.custom_exceptions import (
 )
 
 
+# Sentencias SQL fijas de insumos (texto constante para aprovechar la caché
+# de sentencias preparadas de sqlite3)
+_INSUMO_INSERT_SQL = """
+            INSERT INTO insumos (
+                nombre, categoria, cantidad_actual, cantidad_minima, cantidad_maxima,
+                unidad_medida, precio_unitario, proveedor, codigo
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """
+_INSUMO_UPDATE_STOCK_SQL = "UPDATE insumos SET cantidad_actual = ? WHERE id = ?"
+
+# Campos actualizables de insumos, en el orden usado para construir el UPDATE
+_INSUMO_UPDATEABLE_FIELDS = (
+    'nombre', 'categoria', 'cantidad_actual', 'cantidad_minima',
+    'cantidad_maxima', 'unidad_medida', 'precio_unitario', 'proveedor',
+    'activo'
+)
+
+
+@lru_cache(maxsize=None)
+def _build_insumo_update_sql(fields: Tuple[str, ...]) -> str:
+    """Genera (una vez por combinación de campos) el UPDATE de insumos"""
+    assignments = ', '.join(f"{field} = ?" for field in fields)
+    return f"UPDATE insumos SET {assignments} WHERE id = ?"
+
+
 class BaseRepository(LoggerMixin):
     """
     Repositorio base con operaciones comum para todas las entidades
@@ -63,12 +89,7 @@ class InsumoRepository(BaseRepository):
             # Generar código único legible para el insumo
             codigo = generar_id("INS")
 
-            sql = """
-            INSERT INTO insumos (
-                nombre, categoria, cantidad_actual, cantidad_minima, cantidad_maxima,
-                unidad_medida, precio_unitario, proveedor, codigo
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
+            sql = _INSUMO_INSERT_SQL
             
             params = (
                 data['nombre'],
@@ -240,25 +261,15 @@ class InsumoRepository(BaseRepository):
             if not self.get_by_id(insumo_id):
                 raise RecordNotFoundException("insumo", str(insumo_id))
             
-            # Construir SQL dinámicamente basado en los campos a actualizar
-            fields = []
-            values = []
-            
-            updateable_fields = [
-                'nombre', 'categoria', 'cantidad_actual', 'cantidad_minima',
-                'cantidad_maxima', 'unidad_medida', 'precio_unitario', 'proveedor',
-                'activo'
-            ]
-            
-            for field in updateable_fields:
-                if field in data:
-                    fields.append(f"{field} = ?")
-                    values.append(data[field])
+            # Construir SQL basado en los campos a actualizar (texto cacheado
+            # por combinación de campos)
+            fields = tuple(field for field in _INSUMO_UPDATEABLE_FIELDS if field in data)
             
             if not fields:
                 return False
             
-            sql = f"UPDATE insumos SET {', '.join(fields)} WHERE id = ?"
+            sql = _build_insumo_update_sql(fields)
+            values = [data[field] for field in fields]
             values.append(insumo_id)
             
             rows_affected = db_connection.execute_command(sql, tuple(values))
@@ -288,6 +299,35 @@ class InsumoRepository(BaseRepository):
         """
         return self.update(insumo_id, {'cantidad_actual': nueva_cantidad})
     
+    def update_stock_bulk(self, updates: List[Tuple[int, int]]) -> List[int]:
+        """
+        Actualiza el stock de varios insumos en una sola transacción.
+        
+        Args:
+            updates: Lista de tuplas (insumo_id, nueva_cantidad)
+            
+        Returns:
+            IDs de los insumos efectivamente actualizados (una fila afectada)
+        """
+        if not updates:
+            return []
+        
+        try:
+            updated_ids = []
+            with db_connection.transaction() as cursor:
+                for insumo_id, cantidad in updates:
+                    cursor.execute(_INSUMO_UPDATE_STOCK_SQL, (cantidad, insumo_id))
+                    if cursor.rowcount > 0:
+                        updated_ids.append(insumo_id)
+            
+            self.logger.info(f"Stock actualizado en lote: {len(updated_ids)} insumos")
+            
+            return updated_ids
+            
+        except Exception as e:
+            self.logger.error(f"Error actualizando stock en lote: {e}")
+            raise DatabaseException(f"Error actualizando stock en lote: {e}")
+    
     def delete(self, insumo_id: int, soft_delete: bool = True) -> bool:
         """
         Elimina un insumo (soft o hard delete).
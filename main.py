@@ -423,9 +423,14 @@ class DelegInsumosApp:
                 
                 self.update_status("Cerrando sistema...")
                 
+                # Guardar el stock encolado y esperar las escrituras en curso
+                # antes de cerrar las conexiones
+                if hasattr(self, 'insumos_tab'):
+                    self.insumos_tab.flush_pending_stock_updates()
+                
                 # Cerrar conexiones de base de datos
                 from database.connection import db_connection
-                db_connection.close_all_connections()
+                db_connection.close_all_connections(include_workers=True)
                 
                 # Detener timers de backup si existen
                 from services.backup_service import backup_service
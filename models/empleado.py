@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
 from datetime import datetime, date
 
-from utils.validators import validate_empleado_data, DataValidator
+from utils.validators import validate_empleado_data
 from utils.helpers import format_date, parse_date
 from utils import generar_id
 from exceptions.custom_exceptions import ValidationException
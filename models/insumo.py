@@ -8,11 +8,14 @@ from typing import Optional, Dict, Any
 from datetime import datetime
 from decimal import Decimal
 
-from utils.validators import validate_insumo_data, DataValidator
+from utils.validators import validate_insumo_data
 from utils.helpers import get_stock_status, format_date
 from utils import generar_id
 from exceptions.custom_exceptions import ValidationException
 
+# Valor monetario cero (Decimal es inmutable: se comparte en vez de reparsear)
+_ZERO_MONEY = Decimal('0.00')
+
 
 @dataclass
 class Insumo:
@@ -354,7 +357,7 @@ def calculate_inventory_value(insumos: list[Insumo]) -> Dict[str, Any]:
     Returns:
         Diccionario con estadísticas de valor del inventario
     """
-    total_value = Decimal('0.00')
+    total_value = _ZERO_MONEY
     total_items = 0
     categories = {}
     
@@ -366,7 +369,7 @@ def calculate_inventory_value(insumos: list[Insumo]) -> Dict[str, Any]:
             # Agrupar por categoría
             cat = insumo.categoria
             if cat not in categories:
-                categories[cat] = {'value': Decimal('0.00'), 'items': 0, 'count': 0}
+                categories[cat] = {'value': _ZERO_MONEY, 'items': 0, 'count': 0}
             
             # Mantener 'value' en 0.00 para compatibilidad
             categories[cat]['items'] += insumo.cantidad_actual
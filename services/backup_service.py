@@ -500,11 +500,14 @@ class BackupService(LoggerMixin):
             # Cerrar conexiones activas
             db_connection.close_all_connections()
             
+            # Ruta de la base actual (se construye una sola vez)
+            db_path = Path(self.db_path)
+            
             # Crear archivo temporal para restauración
-            temp_path = Path(self.db_path).with_suffix('.temp')
+            temp_path = db_path.with_suffix('.temp')
             
             # Descomprimir si es necesario
-            if str(backup_path).endswith('.gz'):
+            if backup_path.suffix == '.gz':
                 with gzip.open(backup_path, 'rb') as f_in:
                     with open(temp_path, 'wb') as f_out:
                         shutil.copyfileobj(f_in, f_out)
@@ -512,23 +515,23 @@ class BackupService(LoggerMixin):
                 copy_file_safe(str(backup_path), str(temp_path))
             
             # Hacer backup de la base actual
-            current_backup = Path(self.db_path).with_suffix('.backup')
-            if Path(self.db_path).exists():
+            current_backup = db_path.with_suffix('.backup')
+            if db_path.exists():
                 copy_file_safe(self.db_path, str(current_backup))
             
             # Reemplazar base de datos actual
-            if Path(self.db_path).exists():
-                Path(self.db_path).unlink()
+            if db_path.exists():
+                db_path.unlink()
             
-            temp_path.rename(self.db_path)
+            temp_path.rename(db_path)
             
             # Validar restauración
-            restored_validation = self._validate_backup(Path(self.db_path))
+            restored_validation = self._validate_backup(db_path)
             if not restored_validation['valid']:
                 # Rollback: restaurar backup anterior
                 if current_backup.exists():
-                    Path(self.db_path).unlink()
-                    current_backup.rename(self.db_path)
+                    db_path.unlink()
+                    current_backup.rename(db_path)
                 
                 raise BackupException("restauracion", "La base restaurada es inválida. Operación revertida.")
             
@@ -3,7 +3,7 @@ DelegInsumos - Microservicio de Insumos
 Maneja toda la lógica de negocio para la gestión de insumos
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from database.operations import insumo_repo
@@ -64,7 +64,8 @@ class MicroInsumosService(LoggerMixin):
         return {
             'success': True,
             'insumo_id': insumo_id,
-            'insumo': insumo.to_dict(),
+            # Registro tal como quedó guardado (incluye el código generado)
+            'insumo': self.obtener_insumo(insumo_id),
             'message': f"Insumo '{insumo.nombre}' creado exitosamente"
         }
     
@@ -291,6 +292,80 @@ class MicroInsumosService(LoggerMixin):
             'message': f"Stock actualizado de {cantidad_anterior} a {nueva_cantidad}"
         }
     
+    @service_exception_handler("MicroInsumosService")
+    def actualizar_stock_bulk(self, updates: List[Tuple[int, int, str]]) -> Dict[str, Any]:
+        """
+        Actualiza el stock de varios insumos con una sola escritura en lote.
+        
+        Si un mismo insumo aparece varias veces, prevalece la última cantidad.
+        Cada insumo se valida por separado, como en actualizar_stock: uno
+        inexistente o con cantidad inválida no impide aplicar los demás.
+        
+        Args:
+            updates: Lista de tuplas (insumo_id, nueva_cantidad, motivo)
+            
+        Returns:
+            Diccionario con los cambios aplicados ('cambios') y los rechazados
+            ('fallos', con el motivo del error); 'success' es False si hubo fallos
+        """
+        self.logger.info(f"Actualizando stock en lote: {len(updates)} cambios")
+        
+        # Consolidar por insumo conservando el último valor solicitado
+        pending: Dict[int, Tuple[int, str]] = {}
+        for insumo_id, nueva_cantidad, motivo in updates:
+            pending[insumo_id] = (nueva_cantidad, motivo)
+        
+        # Validar cada insumo y capturar su cantidad anterior
+        cambios = []
+        fallos = []
+        for insumo_id, (nueva_cantidad, motivo) in pending.items():
+            cambio = {
+                'insumo_id': insumo_id,
+                'cantidad_nueva': nueva_cantidad,
+                'motivo': motivo
+            }
+            
+            if nueva_cantidad < 0:
+                fallos.append(dict(cambio, error="La cantidad de stock no puede ser negativa"))
+                continue
+            
+            existing_data = self._repository.get_by_id(insumo_id)
+            if not existing_data:
+                fallos.append(dict(cambio, error=str(RecordNotFoundException("insumo", str(insumo_id)))))
+                continue
+            
+            cambio['cantidad_anterior'] = existing_data.get('cantidad_actual', 0)
+            cambios.append(cambio)
+        
+        updated_ids = set(self._repository.update_stock_bulk(
+            [(cambio['insumo_id'], cambio['cantidad_nueva']) for cambio in cambios]
+        ))
+        
+        # Filas que no llegaron a actualizarse (p. ej. borradas entretanto)
+        for cambio in cambios:
+            if cambio['insumo_id'] not in updated_ids:
+                fallos.append(dict(cambio, error="No se pudo actualizar el stock"))
+        cambios = [cambio for cambio in cambios if cambio['insumo_id'] in updated_ids]
+        
+        for cambio in cambios:
+            log_operation("STOCK_ACTUALIZADO",
+                         f"ID: {cambio['insumo_id']}, Anterior: {cambio['cantidad_anterior']}, "
+                         f"Nuevo: {cambio['cantidad_nueva']}, Motivo: {cambio['motivo']}")
+        
+        for fallo in fallos:
+            self.logger.warning(f"Stock no actualizado para insumo {fallo['insumo_id']}: {fallo['error']}")
+        
+        message = f"Stock actualizado en {len(cambios)} insumo(s)"
+        if fallos:
+            message += f"; {len(fallos)} no se pudieron actualizar"
+        
+        return {
+            'success': not fallos,
+            'cambios': cambios,
+            'fallos': fallos,
+            'message': message
+        }
+    
     @service_exception_handler("MicroInsumosService")
     def reducir_stock_por_entrega(self, insumo_id: int, cantidad_entregada: int) -> Dict[str, Any]:
         """
@@ -9,6 +9,7 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, date, timedelta
 from pathlib import Path
 from decimal import Decimal
+from functools import lru_cache
 import io
 
 # Librerías para reportes
@@ -39,13 +40,19 @@ from services.micro_entregas import micro_entregas
 from services.micro_alertas import micro_alertas
 from config.config_manager import config
 from utils.logger import LoggerMixin, log_operation
-from utils.helpers import format_date, safe_filename
+from utils.helpers import format_date, safe_filename, get_stock_status_batch
 from exceptions.custom_exceptions import (
     service_exception_handler,
     ReportGenerationException
 )
 
 
+@lru_cache(maxsize=8192)
+def _format_file_timestamp(timestamp_ns: int) -> str:
+    """Formatea un timestamp de archivo (ns) para visualización (memorizado)"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9).strftime('%d/%m/%Y %H:%M')
+
+
 class ReportColors:
     """Colores institucionales para reportes"""
     AZUL_PRINCIPAL = HexColor("#2196F3")
@@ -65,6 +72,21 @@ class ReportesService(LoggerMixin):
     Servicio para generación de reportes profesionales en PDF y Excel
     """
     
+    # Tipo e ícono de reporte según palabra clave en el nombre del archivo
+    # (se evalúan en orden; sin coincidencia se usa _DEFAULT_REPORT_TYPE)
+    _REPORT_TYPES = (
+        ('inventario', 'Inventario', '📦'),
+        ('entregas', 'Entregas', '📋'),
+        ('empleados', 'Empleados', '👥'),
+        ('alertas', 'Alertas', '⚠️'),
+    )
+    _DEFAULT_REPORT_TYPE = ('General', '📄')
+    
+    # Etiqueta y color de celda Excel por código de estado de stock
+    # (mismo orden que utils.helpers.STOCK_STATUS_CODES)
+    _STOCK_STATUS_LABELS = ("CRÍTICO", "BAJO", "EXCESO", "NORMAL")
+    _STOCK_STATUS_EXCEL_COLORS = ('F44336', 'FF9800', '757575', '4CAF50')
+    
     def __init__(self):
         super().__init__()
         self.report_config = config.get_reports_config()
@@ -76,6 +98,15 @@ class ReportesService(LoggerMixin):
         
         self.logger.info("ReportesService inicializado")
     
+    @staticmethod
+    def _stock_status_codes(insumos: List[Dict[str, Any]]):
+        """Calcula en una sola pasada el código de estado de stock de cada insumo."""
+        return get_stock_status_batch(
+            [ins['cantidad_actual'] for ins in insumos],
+            [ins['cantidad_minima'] for ins in insumos],
+            [ins['cantidad_maxima'] for ins in insumos]
+        )['code']
+    
     def _get_report_filename(self, report_type: str, extension: str = "pdf") -> str:
         """Genera nombre de archivo para reporte"""
         timestamp = datetime.now().strftime(self.report_config.get('formato_fecha_archivo', '%Y%m%d_%H%M%S'))
@@ -270,26 +301,15 @@ class ReportesService(LoggerMixin):
             # Inventario Detallado (Top 20)
             elements.append(Paragraph("Inventario Detallado (Top 20)", styles['Heading2']))
             # Ordenar por estado de criticidad: crítico, bajo, exceso, normal
-            def _estado_rank(item):
-                cant = item['cantidad_actual']
-                if cant <= 0:
-                    return 0
-                if cant <= item['cantidad_minima']:
-                    return 1
-                if cant >= item['cantidad_maxima']:
-                    return 2
-                return 3
-            insumos_ordenados = sorted(insumos_data['insumos'], key=_estado_rank)
+            # (el código de estado coincide con ese orden; argsort estable
+            # conserva el orden original dentro de cada estado)
+            insumos = insumos_data['insumos']
+            estados = self._stock_status_codes(insumos)
+            orden = estados.argsort(kind='stable')[:20]
             detalle_data = [['Código', 'Nombre', 'Categoría', 'Stock', 'Mín.', 'Máx.', 'Unidad', 'Estado']]
-            for ins in insumos_ordenados[:20]:
-                if ins['cantidad_actual'] <= 0:
-                    estado = "CRÍTICO"
-                elif ins['cantidad_actual'] <= ins['cantidad_minima']:
-                    estado = "BAJO"
-                elif ins['cantidad_actual'] >= ins['cantidad_maxima']:
-                    estado = "EXCESO"
-                else:
-                    estado = "NORMAL"
+            for idx in orden:
+                ins = insumos[idx]
+                estado = self._STOCK_STATUS_LABELS[estados[idx]]
                 detalle_data.append([
                     ins.get('codigo', ins.get('id')),
                     ins['nombre'],
@@ -405,7 +425,8 @@ class ReportesService(LoggerMixin):
                 cell.alignment = Alignment(horizontal='center')
             
             # Datos de insumos
-            for row, insumo in enumerate(insumos_data['insumos'], 2):
+            estados = self._stock_status_codes(insumos_data['insumos'])
+            for row, (insumo, codigo_estado) in enumerate(zip(insumos_data['insumos'], estados), 2):
                 ws_inventario.cell(row=row, column=1, value=insumo.get('codigo', insumo.get('id')))
                 ws_inventario.cell(row=row, column=2, value=insumo['nombre'])
                 ws_inventario.cell(row=row, column=3, value=insumo['categoria'])
@@ -415,18 +436,8 @@ class ReportesService(LoggerMixin):
                 ws_inventario.cell(row=row, column=7, value=insumo['unidad_medida'])
                 
                 # Estado basado en stock
-                if insumo['cantidad_actual'] <= 0:
-                    estado = "CRÍTICO"
-                    color = 'F44336'
-                elif insumo['cantidad_actual'] <= insumo['cantidad_minima']:
-                    estado = "BAJO"
-                    color = 'FF9800'
-                elif insumo['cantidad_actual'] >= insumo['cantidad_maxima']:
-                    estado = "EXCESO"
-                    color = '757575'
-                else:
-                    estado = "NORMAL"
-                    color = '4CAF50'
+                estado = self._STOCK_STATUS_LABELS[codigo_estado]
+                color = self._STOCK_STATUS_EXCEL_COLORS[codigo_estado]
                 
                 estado_cell = ws_inventario.cell(row=row, column=8, value=estado)
                 estado_cell.fill = PatternFill(start_color=color, end_color=color, fill_type='solid')
@@ -1269,6 +1280,38 @@ class ReportesService(LoggerMixin):
             self.logger.error(f"Error generando reporte de empleados Excel: {e}")
             raise ReportGenerationException("empleados_excel", str(e))
 
+    def _build_report_info(self, filename: str, filepath: str, stat: os.stat_result) -> Dict[str, Any]:
+        """Arma la información de un archivo de reporte a partir de su stat"""
+        stem, suffix = os.path.splitext(filename)
+        
+        # Determinar tipo de reporte basado en el nombre
+        name_lower = stem.lower()
+        report_type, icon = next(
+            (
+                (type_name, type_icon)
+                for keyword, type_name, type_icon in self._REPORT_TYPES
+                if keyword in name_lower
+            ),
+            self._DEFAULT_REPORT_TYPE
+        )
+        
+        size_mb = round(stat.st_size / (1024*1024), 2)
+        
+        return {
+            'filename': filename,
+            'filepath': filepath,
+            'type': report_type,
+            'format': suffix.upper().replace('.', ''),
+            'size_mb': size_mb,
+            'size_bytes': stat.st_size,
+            'size_display': f"{size_mb:.2f} MB",
+            'created_at': datetime.fromtimestamp(stat.st_ctime).isoformat(),
+            'modified_at': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            'created_display': _format_file_timestamp(stat.st_ctime_ns),
+            'modified_display': _format_file_timestamp(stat.st_mtime_ns),
+            'icon': icon
+        }
+    
     @service_exception_handler("ReportesService")
     def listar_reportes_disponibles(self) -> List[Dict[str, Any]]:
         """
@@ -1282,44 +1325,16 @@ class ReportesService(LoggerMixin):
         try:
             reportes = []
             
-            # Escanear directorio de reportes
+            # Escanear directorio de reportes (una sola pasada con scandir:
+            # el tipo de entrada viene del directorio y se hace un único stat)
             if self.output_dir.exists():
-                for file_path in self.output_dir.iterdir():
-                    if file_path.is_file() and file_path.suffix in ['.pdf', '.xlsx']:
-                        # Obtener información del archivo
-                        stat = file_path.stat()
+                with os.scandir(self.output_dir) as entries:
+                    for entry in entries:
+                        if os.path.splitext(entry.name)[1] not in ('.pdf', '.xlsx') or not entry.is_file():
+                            continue
                         
-                        # Determinar tipo de reporte basado en el nombre
-                        name_lower = file_path.stem.lower()
-                        if 'inventario' in name_lower:
-                            report_type = 'Inventario'
-                            icon = '📦'
-                        elif 'entregas' in name_lower:
-                            report_type = 'Entregas'
-                            icon = '📋'
-                        elif 'empleados' in name_lower:
-                            report_type = 'Empleados'
-                            icon = '👥'
-                        elif 'alertas' in name_lower:
-                            report_type = 'Alertas'
-                            icon = '⚠️'
-                        else:
-                            report_type = 'General'
-                            icon = '📄'
-                        
-                        reporte_info = {
-                            'filename': file_path.name,
-                            'filepath': str(file_path),
-                            'type': report_type,
-                            'format': file_path.suffix.upper().replace('.', ''),
-                            'size_mb': round(stat.st_size / (1024*1024), 2),
-                            'size_bytes': stat.st_size,
-                            'created_at': datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                            'modified_at': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                            'icon': icon
-                        }
-                        
-                        reportes.append(reporte_info)
+                        # Obtener información del archivo
+                        reportes.append(self._build_report_info(entry.name, entry.path, entry.stat()))
             
             # Ordenar por fecha de modificación descendente
             reportes.sort(key=lambda x: x['modified_at'], reverse=True)
@@ -1330,6 +1345,23 @@ class ReportesService(LoggerMixin):
             self.logger.error(f"Error listando reportes: {e}")
             return []
     
+    def obtener_info_reporte(self, filepath: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene la información de un único reporte (mismo formato que
+        listar_reportes_disponibles) sin recorrer el directorio.
+        
+        Args:
+            filepath: Ruta del archivo de reporte
+            
+        Returns:
+            Información del reporte o None si no se pudo leer
+        """
+        try:
+            return self._build_report_info(os.path.basename(filepath), filepath, os.stat(filepath))
+        except OSError as e:
+            self.logger.error(f"Error obteniendo información del reporte {filepath}: {e}")
+            return None
+    
     @service_exception_handler("ReportesService")
     def eliminar_reporte(self, filename: str) -> Dict[str, Any]:
         """
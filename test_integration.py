@@ -58,6 +58,12 @@ def test_system_integration():
         # Test 10: Integración entre módulos
         run_test("🔗 Integración entre Módulos", test_module_integration, test_results)
         
+        # Test 11: Copia segura de archivos
+        run_test("📁 Copia Segura de Archivos", test_file_copy_safety, test_results)
+        
+        # Test 12: Validadores generados frente a la especificación
+        run_test("🧬 Validadores Generados", test_generated_validators_match_reference, test_results)
+        
     except Exception as e:
         print(f"\n❌ ERROR CRÍTICO EN PRUEBAS: {e}")
         print(f"Stack trace: {traceback.format_exc()}")
@@ -901,6 +907,110 @@ def test_data_validations():
         return False
 
 
+def test_file_copy_safety():
+    """Prueba 11: Copia de archivos sobre sí mismos y hacia directorios"""
+    
+    import shutil
+    import tempfile
+    
+    from utils.helpers import fast_copy, copy_file_safe
+    
+    print("📁 Probando copia segura de archivos...")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source = Path(tmp_dir) / "origen.txt"
+        source.write_bytes(b"contenido de prueba")
+        
+        # Copiar un archivo sobre sí mismo no debe truncarlo
+        print("  🔁 Copia sobre el mismo archivo...")
+        try:
+            fast_copy(str(source), str(source))
+            raise AssertionError("fast_copy debería rechazar el mismo archivo")
+        except shutil.SameFileError:
+            pass
+        assert not copy_file_safe(str(source), str(source))
+        assert source.read_bytes() == b"contenido de prueba"
+        print("    ✅ Rechazada sin modificar el archivo")
+        
+        # Un directorio destino recibe destino/basename(fuente), como copy2
+        print("  📂 Copia hacia un directorio...")
+        dest_dir = Path(tmp_dir) / "destino"
+        dest_dir.mkdir()
+        
+        copied = fast_copy(str(source), str(dest_dir))
+        assert copied == str(dest_dir / "origen.txt")
+        assert (dest_dir / "origen.txt").read_bytes() == b"contenido de prueba"
+        
+        assert copy_file_safe(str(source), str(dest_dir))
+        
+        # El archivo ya copiado sobre su propio directorio es el mismo archivo
+        assert not copy_file_safe(copied, str(dest_dir))
+        assert (dest_dir / "origen.txt").read_bytes() == b"contenido de prueba"
+        print("    ✅ Copiado como destino/origen.txt")
+    
+    print("✅ Copia segura de archivos funcionando correctamente")
+    return True
+
+
+def test_generated_validators_match_reference():
+    """Prueba 12: Los validadores generados equivalen a _validate_fields"""
+    
+    from utils import validators
+    from exceptions.custom_exceptions import ValidationException
+    
+    print("🧬 Comparando validadores generados con la especificación...")
+    
+    def outcome(func, data):
+        try:
+            return ('ok', func(data))
+        except ValidationException as e:
+            return ('error', str(e))
+    
+    # Valores válidos e inválidos para cada tipo de campo (vacíos, espacios,
+    # límites, tipos incorrectos y caracteres que se sanean)
+    samples = [
+        None, '', '   ', 0, 1, -1, 5, '10', ' 7 ', 'abc', 3.5, True,
+        'x', 'Guantes <nitrilo>', 'a' * 20, 'a' * 21, 'b' * 101, 'c' * 501,
+        '12345678', '123', 'ana@test.com', 'correo_invalido',
+        '+57 300 111 2222', 'abc123', '2024-01-15', '15/01/2024', date(2024, 1, 15),
+    ]
+    
+    # Registro válido por entidad; cada caso cambia un solo campo
+    entities = [
+        (validators._INSUMO_FIELDS, validators.validate_insumo_data, {
+            'nombre': 'Guantes', 'categoria': 'EPP', 'cantidad_actual': 10,
+            'cantidad_minima': 5, 'cantidad_maxima': 100,
+            'unidad_medida': 'par', 'proveedor': 'Proveedor Test'
+        }),
+        (validators._EMPLEADO_FIELDS, validators.validate_empleado_data, {
+            'nombre_completo': 'María García', 'cargo': 'Analista',
+            'departamento': 'Administración', 'cedula': '87654321',
+            'email': 'maria@test.com', 'telefono': '+57 300 111 2222',
+            'fecha_ingreso': '2024-01-15'
+        }),
+        (validators._ENTREGA_FIELDS, validators.validate_entrega_data, {
+            'empleado_id': 1, 'insumo_id': 2, 'cantidad': 3,
+            'observaciones': 'Sin novedad', 'entregado_por': 'Admin'
+        }),
+    ]
+    
+    for fields, generated, valid in entities:
+        cases = [{}, valid]
+        for key in valid:
+            cases.append({other: value for other, value in valid.items() if other != key})
+            for sample in samples:
+                cases.append(dict(valid, **{key: sample}))
+        
+        for data in cases:
+            expected = outcome(lambda d: validators._validate_fields(d, fields), data)
+            assert outcome(generated, data) == expected, (generated.__name__, data, expected)
+        
+        print(f"    ✅ {generated.__name__}: {len(cases)} casos idénticos")
+    
+    print("✅ Validadores generados equivalentes a la especificación")
+    return True
+
+
 def test_module_integration():
     """Prueba 10: Integración entre módulos"""
     
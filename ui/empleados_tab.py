@@ -23,7 +23,7 @@ from utils.helpers import (
     format_date, show_error_message, show_info_message, 
     ask_yes_no, DEPARTAMENTOS
 )
-from utils.validators import validate_empleado_data, DataValidator
+from utils.validators import validate_empleado_data
 from exceptions.custom_exceptions import ValidationException, DuplicateRecordException
 
 
@@ -168,7 +168,7 @@ class EmpleadosTab(LoggerMixin):
         departamento_combo = ttk.Combobox(
             filters_subframe,
             textvariable=self.filter_departamento,
-            values=["Todos"] + DEPARTAMENTOS,
+            values=("Todos", *DEPARTAMENTOS),
             state="readonly",
             bootstyle="primary"
         )
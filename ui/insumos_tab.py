@@ -4,33 +4,67 @@ Interfaz completa CRUD para gestión de insumos e inventario
 """
 
 import tkinter as tk
-from tkinter import messagebox
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Any, List
 
 try:
     import ttkbootstrap as ttk
     from ttkbootstrap.constants import *
-    from ttkbootstrap.dialogs import Messagebox
     from ttkbootstrap.scrolled import ScrolledFrame
 except ImportError:
     print("Error: ttkbootstrap requerido")
 
 from services.micro_insumos import micro_insumos
-from models.insumo import Insumo
 from utils.logger import LoggerMixin, log_user_action
 from utils.helpers import (
     show_error_message, show_info_message,
     ask_yes_no, CATEGORIAS_INSUMOS, UNIDADES_MEDIDA
 )
-from utils.validators import validate_insumo_data
 from exceptions.custom_exceptions import ValidationException, DuplicateRecordException
 
 
+# Valores fijos de los filtros (compartidos entre instancias del tab)
+_CATEGORIAS_FILTER_VALUES = ("Todas", *CATEGORIAS_INSUMOS)
+_STATUS_FILTER_VALUES = ("Todos", "Crítico", "Bajo", "Normal", "Exceso")
+
+
 class InsumosTab(LoggerMixin):
     """
     Tab para gestión completa de insumos
     """
     
+    # Tuplas de tags zebra preasignadas (filas pares / impares)
+    _ZEBRA_TAGS = (("zebra_even",), ("zebra_odd",))
+    
+    # Máximo de combinaciones de filtros memorizadas
+    _FILTER_CACHE_SIZE = 8
+    
+    # Intervalo (ms) de sondeo de operaciones en segundo plano
+    _ASYNC_POLL_MS = 30
+    
+    # Espera (ms) para agrupar actualizaciones de stock consecutivas
+    _STOCK_FLUSH_DELAY_MS = 300
+    
+    # Campos obligatorios del formulario: (clave, widget a enfocar, mensaje)
+    _REQUIRED_FIELDS = (
+        ('nombre', 'form_nombre_entry', "El nombre del insumo es obligatorio"),
+        ('categoria', 'form_categoria_combo', "La categoría es obligatoria"),
+    )
+    
+    # Intervalo (ms) de la recarga completa de sincronización
+    _RECONCILE_INTERVAL_MS = 60 * 60 * 1000
+    
+    # Motivos sugeridos en el diálogo de actualización de stock
+    _MOTIVO_VALUES = (
+        "Recepción de mercancía",
+        "Corrección de inventario",
+        "Devolución de insumos",
+        "Ajuste por auditoría",
+        "Otros"
+    )
+    
     def __init__(self, parent, app_instance):
         super().__init__()
         self.parent = parent
@@ -46,8 +80,38 @@ class InsumosTab(LoggerMixin):
         # Variables de datos
         self.insumos_list = []
         self.selected_insumo = None
+        # ID interno del insumo seleccionado (int) o None en modo creación
+        self.selected_insumo_id = None
         # Mapa local para guardar los datos completos de cada item del treeview
         self._item_data = {}
+        # Filas de visualización precalculadas por insumo (id del dict -> (values, tags))
+        self._display_rows = {}
+        # Resultados de filtrado recientes: (búsqueda, categoría, estado, versión) -> índices
+        self._filter_cache = OrderedDict()
+        self._cached_version = 0
+        # Item del tree visible para cada id de insumo
+        self._row_iid_by_id = {}
+        # Últimos valores mostrados en las etiquetas de estadísticas
+        self._last_stats_text = None
+        self._last_alerts_text = None
+        self._last_alerts_style = None
+        # Operaciones de base de datos fuera del hilo de Tk (un solo worker
+        # para que las escrituras se apliquen en el orden en que se pidieron)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="insumos_tab")
+        # after() de sondeo pendiente por Future (se cancelan al destruir el tab)
+        self._poll_jobs = {}
+        # Actualizaciones de stock pendientes: (insumo_id, nueva_cantidad, motivo)
+        self._stock_update_queue = []
+        self._flush_job = None
+        # Cantidad previa a los cambios pendientes por insumo (para revertir el formulario)
+        self._stock_rollback = {}
+        # Contador de lotes de actualización de UI activos (ver _batch_ui)
+        self._batch_depth = 0
+        # Lotes abiertos ahora mismo y trazas retiradas por el más externo
+        self._batch_nesting = 0
+        self._batch_traces = []
+        # Diálogo de actualización de stock (se construye al primer uso)
+        self._stock_dialog = None
         
         # Variables de formulario
         self._init_form_variables()
@@ -58,6 +122,15 @@ class InsumosTab(LoggerMixin):
         # Cargar datos inicial
         self.refresh_data()
         
+        # Los guardados actualizan filas en sitio; recargar todo cada hora
+        self._reconcile_job = self.frame.after(self._RECONCILE_INTERVAL_MS, self._reconcile_data)
+        
+        # Construir el diálogo de stock en tiempo ocioso, no en el primer clic
+        self.frame.after_idle(self._prebuild_stock_dialog)
+        
+        # Guardar el stock encolado y liberar el executor al destruir el tab
+        self.frame.bind("<Destroy>", self._on_destroy, add="+")
+        
         self.logger.info("InsumosTab inicializado")
     
     def _init_form_variables(self):
@@ -74,6 +147,17 @@ class InsumosTab(LoggerMixin):
         self.form_unidad_medida = tk.StringVar(value="unidad")
         self.form_proveedor = tk.StringVar()
         
+        # Campos enviados al servicio: (clave, variable, aplicar strip)
+        self._form_vars = (
+            ('nombre', self.form_nombre, True),
+            ('categoria', self.form_categoria, True),
+            ('cantidad_actual', self.form_cantidad_actual, False),
+            ('cantidad_minima', self.form_cantidad_minima, False),
+            ('cantidad_maxima', self.form_cantidad_maxima, False),
+            ('unidad_medida', self.form_unidad_medida, False),
+            ('proveedor', self.form_proveedor, True),
+        )
+        
         # Variables de filtros
         self.filter_categoria = tk.StringVar()
         self.filter_search = tk.StringVar()
@@ -163,7 +247,7 @@ class InsumosTab(LoggerMixin):
         categoria_combo = ttk.Combobox(
             filters_subframe,
             textvariable=self.filter_categoria,
-            values=["Todas"] + CATEGORIAS_INSUMOS,
+            values=_CATEGORIAS_FILTER_VALUES,
             state="readonly",
             bootstyle="primary"
         )
@@ -176,7 +260,7 @@ class InsumosTab(LoggerMixin):
         status_combo = ttk.Combobox(
             filters_subframe,
             textvariable=self.filter_stock_status,
-            values=["Todos", "Crítico", "Bajo", "Normal", "Exceso"],
+            values=_STATUS_FILTER_VALUES,
             state="readonly",
             bootstyle="primary"
         )
@@ -236,6 +320,9 @@ class InsumosTab(LoggerMixin):
         tree_frame.grid_rowconfigure(0, weight=1)
         tree_frame.grid_columnconfigure(0, weight=1)
         
+        # Colores por estado (una sola vez por widget)
+        self._configure_tags()
+        
         # Eventos del tree
         self.insumos_tree.bind("<<TreeviewSelect>>", self._on_insumo_selected)
         self.insumos_tree.bind("<Double-1>", lambda e: self._edit_selected_insumo())
@@ -260,6 +347,18 @@ class InsumosTab(LoggerMixin):
         )
         self.alerts_label.pack(side=RIGHT)
     
+    def _configure_tags(self):
+        """Configura los colores de los tags del tree de insumos"""
+        # Crítico: rojo
+        self.insumos_tree.tag_configure("critico", background="#FFCDD2", foreground="#B71C1C")
+        # Bajo: naranja
+        self.insumos_tree.tag_configure("bajo", background="#FFE0B2", foreground="#BF360C")
+        # Exceso: azul (informativo, no error)
+        self.insumos_tree.tag_configure("exceso", background="#E3F2FD", foreground="#0D47A1")
+        # Zebra pattern para filas en estado NORMAL (verde suave)
+        self.insumos_tree.tag_configure("zebra_even", background="#E8F5E9", foreground="#1B5E20")
+        self.insumos_tree.tag_configure("zebra_odd", background="#C8E6C9", foreground="#1B5E20")
+    
     def _create_form_panel(self, parent):
         """Crea el panel del formulario de insumos"""
         
@@ -473,6 +572,12 @@ class InsumosTab(LoggerMixin):
             # Obtener lista de insumos con estado
             result = micro_insumos.listar_insumos(active_only=True, include_status=True)
             self.insumos_list = result.get('insumos', [])
+            self._display_rows = {
+                id(insumo): self._build_display_row(insumo)
+                for insumo in self.insumos_list
+            }
+            # Los datos cambiaron: invalidar resultados de filtrado previos
+            self._invalidate_filter_cache()
             
             # Aplicar filtros actuales
             self._apply_filters()
@@ -500,112 +605,213 @@ class InsumosTab(LoggerMixin):
             categoria_filter = self.filter_categoria.get()
             status_filter = self.filter_stock_status.get()
             
+            # Reutilizar un filtrado reciente si existe
+            cache_key = (search_term, categoria_filter, status_filter, self._cached_version)
+            filtered_indices = self._filter_cache.get(cache_key)
+            if filtered_indices is not None:
+                self._filter_cache.move_to_end(cache_key)
+                self._show_filtered(filtered_indices)
+                return
+            
             # Filtrar lista
-            filtered_insumos = []
+            filtered_indices = []
             
-            for insumo in self.insumos_list:
-                # Filtro de búsqueda
-                if search_term:
-                    searchable_text = f"{insumo['codigo']} {insumo['nombre']} {insumo['categoria']} {insumo.get('proveedor', '')}".lower()
-                    if search_term not in searchable_text:
-                        continue
-                
-                # Filtro de categoría
-                if categoria_filter and categoria_filter != "Todas":
-                    if insumo['categoria'] != categoria_filter:
-                        continue
-                
-                # Filtro de estado de stock
-                if status_filter and status_filter != "Todos":
-                    current = insumo['cantidad_actual']
-                    minimum = insumo['cantidad_minima']
-                    maximum = insumo['cantidad_maxima']
-                    
-                    if status_filter == "Crítico" and current > 0:
-                        continue
-                    elif status_filter == "Bajo" and (current <= 0 or current > minimum):
-                        continue
-                    elif status_filter == "Normal" and (current <= 0 or current <= minimum or current >= maximum):
-                        continue
-                    elif status_filter == "Exceso" and current < maximum:
-                        continue
-                
-                filtered_insumos.append(insumo)
+            matches = self._matches_filters
+            for idx, insumo in enumerate(self.insumos_list):
+                if matches(insumo, search_term, categoria_filter, status_filter):
+                    filtered_indices.append(idx)
+            
+            # Memorizar resultado (LRU acotado)
+            self._filter_cache[cache_key] = filtered_indices
+            if len(self._filter_cache) > self._FILTER_CACHE_SIZE:
+                self._filter_cache.popitem(last=False)
             
             # Actualizar tree con insumos filtrados
-            self._update_tree_display(filtered_insumos)
+            self._show_filtered(filtered_indices)
             
         except Exception as e:
             self.logger.error(f"Error aplicando filtros: {e}")
     
+    @staticmethod
+    def _matches_filters(insumo: Dict[str, Any], search_term: str,
+                         categoria_filter: str, status_filter: str) -> bool:
+        """Indica si un insumo cumple los filtros de búsqueda, categoría y estado"""
+        # Filtro de búsqueda
+        if search_term:
+            searchable_text = f"{insumo['codigo']} {insumo['nombre']} {insumo['categoria']} {insumo.get('proveedor', '')}".lower()
+            if search_term not in searchable_text:
+                return False
+        
+        # Filtro de categoría
+        if categoria_filter and categoria_filter != "Todas":
+            if insumo['categoria'] != categoria_filter:
+                return False
+        
+        # Filtro de estado de stock
+        if status_filter and status_filter != "Todos":
+            current = insumo['cantidad_actual']
+            minimum = insumo['cantidad_minima']
+            maximum = insumo['cantidad_maxima']
+            
+            if status_filter == "Crítico" and current > 0:
+                return False
+            elif status_filter == "Bajo" and (current <= 0 or current > minimum):
+                return False
+            elif status_filter == "Normal" and (current <= 0 or current <= minimum or current >= maximum):
+                return False
+            elif status_filter == "Exceso" and current < maximum:
+                return False
+        
+        return True
+    
+    def _show_filtered(self, indices: List[int]):
+        """Muestra en el tree los insumos indicados por posición"""
+        insumos = self.insumos_list
+        self._update_tree_display([insumos[i] for i in indices])
+    
+    def _build_display_row(self, insumo: Dict[str, Any]):
+        """Construye la tupla de valores y el tag de estado de una fila"""
+        current = insumo['cantidad_actual']
+        minimum = insumo['cantidad_minima']
+        maximum = insumo['cantidad_maxima']
+        
+        if current <= 0:
+            estado, tag = "CRÍTICO", "critico"
+        elif current <= minimum:
+            estado, tag = "BAJO", "bajo"
+        elif current >= maximum:
+            estado, tag = "EXCESO", "exceso"
+        else:
+            estado, tag = "NORMAL", None
+        
+        unidad = insumo['unidad_medida']
+        values = (
+            insumo.get('codigo', ''),
+            insumo['categoria'],
+            f"{current} {unidad}",
+            f"{minimum} {unidad}",
+            estado,
+            insumo.get('proveedor', 'No especificado')[:20]
+        )
+        # Los estados especiales tienen color propio; NORMAL usa zebra
+        return values, ((tag,) if tag else None)
+    
     def _update_tree_display(self, insumos: List[Dict[str, Any]]):
         """Actualiza la visualización del tree con los insumos"""
         try:
             # Limpiar tree
             for item in self.insumos_tree.get_children():
                 self.insumos_tree.delete(item)
+            self._item_data.clear()
+            self._row_iid_by_id.clear()
+            
+            tree_insert = self.insumos_tree.insert
+            display_rows = self._display_rows
+            zebra_tags = self._ZEBRA_TAGS
             
             # Agregar insumos (con zebra para filas en estado normal)
             for idx, insumo in enumerate(insumos):
-                # Determinar estado de stock y color
-                current = insumo['cantidad_actual']
-                minimum = insumo['cantidad_minima']
-                maximum = insumo['cantidad_maxima']
-                
-                if current <= 0:
-                    estado = "CRÍTICO"
-                    tag = "critico"
-                elif current <= minimum:
-                    estado = "BAJO"
-                    tag = "bajo"
-                elif current >= maximum:
-                    estado = "EXCESO"
-                    tag = "exceso"
-                else:
-                    estado = "NORMAL"
-                    tag = "normal"
+                # Valores precalculados en refresh_data
+                row = display_rows.get(id(insumo))
+                if row is None:
+                    row = display_rows[id(insumo)] = self._build_display_row(insumo)
+                values, status_tags = row
                 
-                # Formatear valores
-                stock_display = f"{current} {insumo['unidad_medida']}"
-                minimo_display = f"{minimum} {insumo['unidad_medida']}"
-                proveedor_display = insumo.get('proveedor', 'No especificado')[:20]
-
-                # Zebra tag solo para filas en estado normal
-                zebra_tag = "zebra_even" if idx % 2 == 0 else "zebra_odd"
-                tags_to_apply = (tag,) if tag in ("critico", "bajo", "exceso") else (zebra_tag,)
-
-                # Insertar en tree
-                item_id = self.insumos_tree.insert(
+                item_id = tree_insert(
                     "", "end",
                     text=insumo['nombre'],
-                    values=(
-                        insumo.get('codigo', ''),
-                        insumo['categoria'],
-                        stock_display,
-                        minimo_display,
-                        estado,
-                        proveedor_display
-                    ),
-                    tags=tags_to_apply
+                    values=values,
+                    tags=status_tags or zebra_tags[idx % 2]
                 )
                 
                 # Guardar datos completos en el item (sin usar columnas ocultas)
                 self._item_data[item_id] = insumo
-            
-            # Configurar colores por tag (estados especiales)
-            # Crítico: rojo
-            self.insumos_tree.tag_configure("critico", background="#FFCDD2", foreground="#B71C1C")
-            # Bajo: naranja
-            self.insumos_tree.tag_configure("bajo", background="#FFE0B2", foreground="#BF360C")
-            # Exceso: azul (informativo, no error)
-            self.insumos_tree.tag_configure("exceso", background="#E3F2FD", foreground="#0D47A1")
-            # Zebra pattern para filas en estado NORMAL (verde suave)
-            self.insumos_tree.tag_configure("zebra_even", background="#E8F5E9", foreground="#1B5E20")
-            self.insumos_tree.tag_configure("zebra_odd", background="#C8E6C9", foreground="#1B5E20")
+                self._row_iid_by_id[insumo.get('id')] = item_id
             
         except Exception as e:
             self.logger.error(f"Error actualizando visualización del tree: {e}")
     
+    def _local_statistics(self) -> Dict[str, Any]:
+        """Calcula las estadísticas de la lista en memoria (sin consultar la BD)"""
+        criticos = bajos = 0
+        for values, status_tags in self._display_rows.values():
+            if status_tags == ("critico",):
+                criticos += 1
+            elif status_tags == ("bajo",):
+                bajos += 1
+        
+        return {
+            'total': len(self.insumos_list),
+            'by_status': {'criticos': criticos, 'bajo_stock': bajos}
+        }
+    
+    def _invalidate_filter_cache(self):
+        """Descarta los filtrados memorizados tras un cambio en los datos"""
+        self._cached_version += 1
+        self._filter_cache.clear()
+    
+    def _upsert_local_insumo(self, insumo: Dict[str, Any]):
+        """
+        Refleja en memoria y en el tree un insumo creado o modificado,
+        sin volver a consultar la lista completa.
+        """
+        insumo_id = insumo.get('id')
+        needs_sort = True
+        
+        for idx, existing in enumerate(self.insumos_list):
+            if existing.get('id') == insumo_id:
+                self._display_rows.pop(id(existing), None)
+                self.insumos_list[idx] = insumo
+                needs_sort = existing['nombre'] != insumo['nombre']
+                break
+        else:
+            self.insumos_list.append(insumo)
+        
+        if needs_sort:
+            # Mismo orden que la consulta (ORDER BY nombre)
+            self.insumos_list.sort(key=lambda item: item['nombre'])
+        
+        row = self._display_rows[id(insumo)] = self._build_display_row(insumo)
+        self._invalidate_filter_cache()
+        
+        iid = self._row_iid_by_id.get(insumo_id)
+        if (iid is not None and not needs_sort and self._matches_filters(
+                insumo,
+                self.filter_search.get().lower().strip(),
+                self.filter_categoria.get(),
+                self.filter_stock_status.get())):
+            # La fila sigue visible en la misma posición: modificarla en sitio
+            values, status_tags = row
+            self.insumos_tree.item(
+                iid,
+                text=insumo['nombre'],
+                values=values,
+                tags=status_tags or self._ZEBRA_TAGS[self.insumos_tree.index(iid) % 2]
+            )
+            self._item_data[iid] = insumo
+        else:
+            # Cambia el conjunto visible: redibujar desde memoria
+            self._apply_filters()
+        
+        self._update_statistics(self._local_statistics())
+    
+    def _remove_local_insumo(self, insumo_id: int):
+        """Quita un insumo de la lista en memoria y del tree"""
+        for idx, existing in enumerate(self.insumos_list):
+            if existing.get('id') == insumo_id:
+                self._display_rows.pop(id(existing), None)
+                del self.insumos_list[idx]
+                break
+        
+        self._invalidate_filter_cache()
+        self._apply_filters()
+        self._update_statistics(self._local_statistics())
+    
+    def _reconcile_data(self):
+        """Recarga periódica completa para sincronizar con cambios externos"""
+        self.refresh_data(quick=True)
+        self._reconcile_job = self.frame.after(self._RECONCILE_INTERVAL_MS, self._reconcile_data)
+    
     def _update_statistics(self, data: Dict[str, Any]):
         """Actualiza las estadísticas mostradas"""
         try:
@@ -615,7 +821,9 @@ class InsumosTab(LoggerMixin):
             
             # Estadísticas básicas (sin valor monetario)
             stats_text = f"Total: {total} insumos"
-            self.stats_label.config(text=stats_text)
+            if stats_text != self._last_stats_text:
+                self.stats_label.config(text=stats_text)
+                self._last_stats_text = stats_text
             
             # Alertas
             criticos = by_status.get('criticos', 0)
@@ -626,9 +834,16 @@ class InsumosTab(LoggerMixin):
                 alerts_text = f"⚠️ {total_alerts} alertas"
                 if criticos > 0:
                     alerts_text += f" (🔴 {criticos} críticas)"
-                self.alerts_label.config(text=alerts_text, bootstyle="danger")
+                alerts_style = "danger"
             else:
-                self.alerts_label.config(text="✅ Sin alertas de stock", bootstyle="success")
+                alerts_text = "✅ Sin alertas de stock"
+                alerts_style = "success"
+            
+            # Evitar llamadas a Tcl si el contenido no cambió
+            if alerts_text != self._last_alerts_text or alerts_style != self._last_alerts_style:
+                self.alerts_label.config(text=alerts_text, bootstyle=alerts_style)
+                self._last_alerts_text = alerts_text
+                self._last_alerts_style = alerts_style
             
         except Exception as e:
             self.logger.error(f"Error actualizando estadísticas: {e}")
@@ -655,8 +870,78 @@ class InsumosTab(LoggerMixin):
         
         self._apply_filters()
     
+    @contextmanager
+    def _batch_ui(self):
+        """
+        Agrupa una actualización masiva del tree y del formulario.
+        
+        El lote más externo saca el tree del grid y retira las trazas de las
+        variables del formulario y de los filtros; ambos se restauran una sola
+        vez al cerrarlo, así que el relayout y el redibujado quedan para el
+        siguiente idle de Tk en lugar de repetirse por cada cambio.
+        
+        Mientras dura el lote se ignoran los <<TreeviewSelect>> generados por
+        las inserciones/borrados; como Tk los encola, la supresión se levanta
+        en after_idle, que solo corre con la cola de eventos ya despachada.
+        """
+        self._batch_depth += 1
+        self._batch_nesting += 1
+        if self._batch_nesting == 1:
+            self.insumos_tree.grid_remove()
+            self._batch_traces = self._detach_traces()
+        try:
+            yield
+        finally:
+            self._batch_nesting -= 1
+            if self._batch_nesting == 0:
+                self._restore_traces(self._batch_traces)
+                self._batch_traces = []
+                self.insumos_tree.grid()
+            self.frame.after_idle(self._end_batch_ui)
+    
+    def _end_batch_ui(self):
+        """Cierra un lote abierto por _batch_ui"""
+        self._batch_depth -= 1
+    
+    def _traced_variables(self):
+        """Variables del formulario y de los filtros cuyas trazas pausa un lote"""
+        return (
+            self.form_id, self.form_codigo,
+            *(variable for _, variable, _ in self._form_vars),
+            self.filter_search, self.filter_categoria, self.filter_stock_status
+        )
+    
+    def _detach_traces(self):
+        """
+        Retira las trazas de las variables del lote.
+        
+        Se usa el comando trace de Tcl (y no trace_remove, que además borra el
+        comando Python) para poder volver a registrarlas tal cual.
+        
+        Returns:
+            Lista de (nombre de variable, modos, callback) retirados
+        """
+        tk_call = self.frame.tk.call
+        detached = []
+        for variable in self._traced_variables():
+            name = str(variable)
+            for modes, callback in variable.trace_info():
+                tk_call('trace', 'remove', 'variable', name, modes, callback)
+                detached.append((name, modes, callback))
+        return detached
+    
+    def _restore_traces(self, detached):
+        """Vuelve a registrar las trazas retiradas por _detach_traces"""
+        tk_call = self.frame.tk.call
+        # trace_info las lista de la más reciente a la más antigua
+        for name, modes, callback in reversed(detached):
+            tk_call('trace', 'add', 'variable', name, modes, callback)
+    
     def _on_insumo_selected(self, event=None):
         """Maneja la selección de un insumo"""
+        if self._batch_depth:
+            return
+        
         selection = self.insumos_tree.selection()
         
         if selection:
@@ -687,11 +972,13 @@ class InsumosTab(LoggerMixin):
         try:
             # Obtener datos del tree item
             self.selected_insumo = {}
+            self.selected_insumo_id = None
             
             # Cargar valores principales
             data = self._item_data.get(tree_item, {})
             # IDs
             self.form_id.set(str(data.get("id", "")))              # interno
+            self.selected_insumo_id = int(data["id"]) if data.get("id") is not None else None
             self.form_codigo.set(data.get("codigo", ""))           # público
 
             # Campos visibles
@@ -772,6 +1059,13 @@ class InsumosTab(LoggerMixin):
         self.form_proveedor.set("")
         
         self.selected_insumo = None
+        self.selected_insumo_id = None
+        
+        # Quitar la selección del tree: una fila actualizada en sitio seguiría
+        # resaltada y volver a pulsarla no emitiría <<TreeviewSelect>>
+        selection = self.insumos_tree.selection()
+        if selection:
+            self.insumos_tree.selection_remove(selection)
         
         # Ocultar botones de edición
         self.update_stock_btn.pack_forget()
@@ -795,53 +1089,72 @@ class InsumosTab(LoggerMixin):
     
     def _save_insumo(self):
         """Guarda el insumo (nuevo o editado)"""
+        update_status = getattr(self.app, 'update_status', None)
         try:
             # Preparar datos del formulario
             form_data = {
-                'nombre': self.form_nombre.get().strip(),
-                'categoria': self.form_categoria.get().strip(),
-                'cantidad_actual': self.form_cantidad_actual.get(),
-                'cantidad_minima': self.form_cantidad_minima.get(),
-                'cantidad_maxima': self.form_cantidad_maxima.get(),
-                'unidad_medida': self.form_unidad_medida.get(),
-                'proveedor': self.form_proveedor.get().strip()
+                key: (var.get().strip() if strip else var.get())
+                for key, var, strip in self._form_vars
             }
             
             # Validar datos básicos
-            if not form_data['nombre']:
-                show_error_message("Error", "El nombre del insumo es obligatorio", self.frame)
-                self.form_nombre_entry.focus_set()
-                return
-            
-            if not form_data['categoria']:
-                show_error_message("Error", "La categoría es obligatoria", self.frame)
-                self.form_categoria_combo.focus_set()
-                return
+            for key, widget_attr, message in self._REQUIRED_FIELDS:
+                if not form_data[key]:
+                    show_error_message("Error", message, self.frame)
+                    getattr(self, widget_attr).focus_set()
+                    return
             
             # Determinar si es creación o actualización
-            is_update = bool(self.selected_insumo and self.form_id.get())
+            is_update = self.selected_insumo_id is not None
             
-            if hasattr(self.app, 'update_status'):
-                action = "Actualizando" if is_update else "Creando"
-                self.app.update_status(f"{action} insumo...")
+            self._save_insumo_impl(form_data, is_update, update_status)
+                
+        except Exception as e:
+            self.save_btn.configure(state="normal")
+            self.logger.error(f"Error guardando insumo: {e}")
+            if update_status:
+                update_status("Error guardando insumo", "danger")
+            show_error_message("Error", f"Error guardando insumo: {str(e)}", self.frame)
+    
+    def _save_insumo_impl(self, form_data: Dict[str, Any], is_update: bool, update_status):
+        """Envía el guardado al servicio (los errores los maneja _save_insumo)"""
+        if update_status:
+            action = "Actualizando" if is_update else "Creando"
+            update_status(f"{action} insumo...")
+        
+        # Evitar envíos duplicados mientras la operación está en curso
+        self.save_btn.configure(state="disabled")
+        
+        if is_update:
+            # Actualizar insumo existente
+            insumo_id = self.selected_insumo_id
+            self._run_async(
+                micro_insumos.actualizar_insumo, insumo_id, form_data,
+                on_done=lambda future: self._on_save_done(future, is_update, f"ID: {insumo_id}")
+            )
+        else:
+            # Crear nuevo insumo
+            self._run_async(
+                micro_insumos.crear_insumo, form_data,
+                on_done=lambda future: self._on_save_done(future, is_update, f"Nombre: {form_data['nombre']}")
+            )
+    
+    def _on_save_done(self, future, is_update: bool, log_details: str):
+        """Procesa el resultado del guardado (en el hilo de Tk)"""
+        update_status = getattr(self.app, 'update_status', None)
+        try:
+            result = future.result()
             
             if is_update:
-                # Actualizar insumo existente
-                insumo_id = int(self.form_id.get())
-                result = micro_insumos.actualizar_insumo(insumo_id, form_data)
-                
-                log_user_action("UPDATE_INSUMO", "insumo_updated", f"ID: {insumo_id}")
+                log_user_action("UPDATE_INSUMO", "insumo_updated", log_details)
             else:
-                # Crear nuevo insumo
-                result = micro_insumos.crear_insumo(form_data)
-                
-                log_user_action("CREATE_INSUMO", "insumo_created", f"Nombre: {form_data['nombre']}")
+                log_user_action("CREATE_INSUMO", "insumo_created", log_details)
             
             if result['success']:
                 action_text = "actualizado" if is_update else "creado"
                 
-                if hasattr(self.app, 'update_status'):
-                    self.app.update_status(f"Insumo {action_text} exitosamente", "success")
+                if update_status:
+                    update_status(f"Insumo {action_text} exitosamente", "success")
                 
                 show_info_message(
                     "Operación Exitosa",
@@ -849,13 +1162,14 @@ class InsumosTab(LoggerMixin):
                     self.frame
                 )
                 
-                # Actualizar lista y limpiar formulario
-                self.refresh_data()
-                self._clear_form()
+                # Actualizar solo la fila afectada y limpiar formulario
+                with self._batch_ui():
+                    self._upsert_local_insumo(result['insumo'])
+                    self._clear_form()
                 
             else:
-                if hasattr(self.app, 'update_status'):
-                    self.app.update_status("Error guardando insumo", "danger")
+                if update_status:
+                    update_status("Error guardando insumo", "danger")
                 show_error_message("Error", "No se pudo guardar el insumo", self.frame)
                 
         except ValidationException as e:
@@ -867,9 +1181,51 @@ class InsumosTab(LoggerMixin):
             
         except Exception as e:
             self.logger.error(f"Error guardando insumo: {e}")
-            if hasattr(self.app, 'update_status'):
-                self.app.update_status("Error guardando insumo", "danger")
+            if update_status:
+                update_status("Error guardando insumo", "danger")
             show_error_message("Error", f"Error guardando insumo: {str(e)}", self.frame)
+        
+        finally:
+            self.save_btn.configure(state="normal")
+    
+    def _run_async(self, func, *args, on_done):
+        """
+        Ejecuta una operación de servicio en segundo plano.
+        
+        El resultado se entrega a on_done (con el Future) desde el hilo de Tk,
+        sondeando con after() para no tocar widgets desde el hilo worker.
+        """
+        future = self._executor.submit(func, *args)
+        self._poll_future(future, on_done)
+    
+    def _poll_future(self, future, on_done):
+        """Espera (sin bloquear la UI) a que termine un Future"""
+        self._poll_jobs.pop(future, None)
+        if future.done():
+            on_done(future)
+        else:
+            self._poll_jobs[future] = self.frame.after(
+                self._ASYNC_POLL_MS, self._poll_future, future, on_done
+            )
+    
+    def _on_destroy(self, event):
+        """Guarda el stock pendiente y libera el executor cuando se destruye el tab"""
+        if event.widget is not self.frame:
+            return
+        
+        # Ningún callback debe volver a tocar los widgets destruidos
+        for job in self._poll_jobs.values():
+            self.frame.after_cancel(job)
+        self._poll_jobs.clear()
+        self.frame.after_cancel(self._reconcile_job)
+        if hasattr(self, '_search_timer'):
+            self.frame.after_cancel(self._search_timer)
+        
+        # Cancela también el envío en lote programado
+        self.flush_pending_stock_updates()
+        
+        # Esperar a que terminen los guardados/eliminaciones ya enviados
+        self._executor.shutdown(wait=True)
     
     def _edit_selected_insumo(self):
         """Edita el insumo seleccionado (doble click)"""
@@ -882,144 +1238,291 @@ class InsumosTab(LoggerMixin):
         """Muestra diálogo para actualización rápida de stock"""
         log_user_action("CLICK", "show_stock_update", "InsumosTab")
         
-        if not self.selected_insumo:
+        if self.selected_insumo_id is None:
             return
         
         try:
-            # Crear ventana de diálogo
-            dialog = ttk.Toplevel(self.app.root)
-            dialog.title("Actualizar Stock")
-            dialog.geometry("400x300")
-            dialog.resizable(False, False)
+            # El diálogo se construye una sola vez y se reutiliza
+            if self._stock_dialog is None or not self._stock_dialog.winfo_exists():
+                self._build_stock_dialog()
             
-            # Centrar diálogo
-            dialog.transient(self.app.root)
-            dialog.grab_set()
+            dialog = self._stock_dialog
             
-            # Contenido del diálogo
-            content = ttk.Frame(dialog, padding="20")
-            content.pack(fill=BOTH, expand=True)
+            # Cargar datos del insumo seleccionado
+            self._stock_title_label.configure(text=f"Actualizar Stock: {self.form_nombre.get()}")
+            self._stock_current_label.configure(
+                text=f"{self.form_cantidad_actual.get()} {self.form_unidad_medida.get()}"
+            )
+            self._stock_new_var.set(self.form_cantidad_actual.get())
+            self._stock_motivo_var.set("")
             
-            # Información actual
-            ttk.Label(
-                content,
-                text=f"Actualizar Stock: {self.form_nombre.get()}",
-                font=("Helvetica", 12, "bold"),
-                bootstyle="primary"
-            ).pack(pady=(0, 15))
+            dialog.deiconify()
+            dialog.grab_set()
             
-            # Stock actual
-            current_frame = ttk.Frame(content)
-            current_frame.pack(fill=X, pady=(0, 10))
+            self._stock_spinbox.focus_set()
+            self._stock_spinbox.select_range(0, tk.END)
             
-            ttk.Label(current_frame, text="Stock actual:").pack(side=LEFT)
-            ttk.Label(
-                current_frame,
-                text=f"{self.form_cantidad_actual.get()} {self.form_unidad_medida.get()}",
-                font=("Helvetica", 10, "bold"),
-                bootstyle="info"
-            ).pack(side=RIGHT)
+        except Exception as e:
+            self.logger.error(f"Error mostrando diálogo de stock: {e}")
+            show_error_message("Error", f"Error abriendo diálogo: {str(e)}", self.frame)
+    
+    def _prebuild_stock_dialog(self):
+        """Construye el diálogo de stock por adelantado (llamado en after_idle)"""
+        try:
+            if self._stock_dialog is None:
+                self._build_stock_dialog()
+        except Exception as e:
+            # Se reintentará al abrir el diálogo
+            self.logger.debug(f"No se pudo preconstruir el diálogo de stock: {e}")
+    
+    def _build_stock_dialog(self):
+        """Construye (oculto) el diálogo de actualización de stock"""
+        # Crear ventana de diálogo
+        dialog = ttk.Toplevel(self.app.root)
+        dialog.withdraw()
+        dialog.title("Actualizar Stock")
+        dialog.geometry("400x300")
+        dialog.resizable(False, False)
+        
+        # Centrar diálogo
+        dialog.transient(self.app.root)
+        
+        # Contenido del diálogo
+        content = ttk.Frame(dialog, padding="20")
+        content.pack(fill=BOTH, expand=True)
+        
+        # Información actual
+        self._stock_title_label = ttk.Label(
+            content,
+            text="",
+            font=("Helvetica", 12, "bold"),
+            bootstyle="primary"
+        )
+        self._stock_title_label.pack(pady=(0, 15))
+        
+        # Stock actual
+        current_frame = ttk.Frame(content)
+        current_frame.pack(fill=X, pady=(0, 10))
+        
+        ttk.Label(current_frame, text="Stock actual:").pack(side=LEFT)
+        self._stock_current_label = ttk.Label(
+            current_frame,
+            text="",
+            font=("Helvetica", 10, "bold"),
+            bootstyle="info"
+        )
+        self._stock_current_label.pack(side=RIGHT)
+        
+        # Nuevo stock
+        new_stock_frame = ttk.Frame(content)
+        new_stock_frame.pack(fill=X, pady=(0, 10))
+        
+        ttk.Label(new_stock_frame, text="Nuevo stock:").pack(side=LEFT)
+        self._stock_new_var = tk.IntVar()
+        self._stock_spinbox = ttk.Spinbox(
+            new_stock_frame,
+            from_=0,
+            to=99999,
+            textvariable=self._stock_new_var,
+            bootstyle="success",
+            width=10
+        )
+        self._stock_spinbox.pack(side=RIGHT)
+        
+        # Motivo del cambio
+        ttk.Label(content, text="Motivo del cambio:").pack(anchor="w", pady=(10, 5))
+        self._stock_motivo_var = tk.StringVar()
+        motivo_combo = ttk.Combobox(
+            content,
+            textvariable=self._stock_motivo_var,
+            values=self._MOTIVO_VALUES,
+            bootstyle="secondary"
+        )
+        motivo_combo.pack(fill=X, pady=(0, 15))
+        
+        # Botones
+        buttons_frame = ttk.Frame(content)
+        buttons_frame.pack(fill=X, pady=(15, 0))
+        
+        ttk.Button(
+            buttons_frame,
+            text="💾 Actualizar Stock",
+            command=self._save_stock_update,
+            bootstyle="success"
+        ).pack(side=LEFT, padx=(0, 5))
+        
+        ttk.Button(
+            buttons_frame,
+            text="❌ Cancelar",
+            command=self._hide_stock_dialog,
+            bootstyle="danger-outline"
+        ).pack(side=RIGHT)
+        
+        # Bind Enter key
+        dialog.bind("<Return>", lambda e: self._save_stock_update())
+        dialog.bind("<Escape>", lambda e: self._hide_stock_dialog())
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_stock_dialog)
+        
+        self._stock_dialog = dialog
+    
+    def _hide_stock_dialog(self):
+        """Oculta el diálogo de stock para reutilizarlo"""
+        self._stock_dialog.grab_release()
+        self._stock_dialog.withdraw()
+    
+    def _save_stock_update(self):
+        """Aplica la actualización de stock indicada en el diálogo"""
+        dialog = self._stock_dialog
+        try:
+            nueva_cantidad = self._stock_new_var.get()
+            motivo = self._stock_motivo_var.get() or "Actualización manual"
             
-            # Nuevo stock
-            new_stock_frame = ttk.Frame(content)
-            new_stock_frame.pack(fill=X, pady=(0, 10))
+            if nueva_cantidad < 0:
+                show_error_message("Error", "La cantidad no puede ser negativa", dialog)
+                return
             
-            ttk.Label(new_stock_frame, text="Nuevo stock:").pack(side=LEFT)
-            new_stock_var = tk.IntVar(value=self.form_cantidad_actual.get())
-            new_stock_spinbox = ttk.Spinbox(
-                new_stock_frame,
-                from_=0,
-                to=99999,
-                textvariable=new_stock_var,
-                bootstyle="success",
-                width=10
-            )
-            new_stock_spinbox.pack(side=RIGHT)
-            new_stock_spinbox.focus_set()
-            new_stock_spinbox.select_range(0, tk.END)
+            self._apply_stock_update(self.selected_insumo_id, nueva_cantidad, motivo)
             
-            # Motivo del cambio
-            ttk.Label(content, text="Motivo del cambio:").pack(anchor="w", pady=(10, 5))
-            motivo_var = tk.StringVar()
-            motivo_combo = ttk.Combobox(
-                content,
-                textvariable=motivo_var,
-                values=[
-                    "Recepción de mercancía",
-                    "Corrección de inventario", 
-                    "Devolución de insumos",
-                    "Ajuste por auditoría",
-                    "Otros"
-                ],
-                bootstyle="secondary"
-            )
-            motivo_combo.pack(fill=X, pady=(0, 15))
+        except Exception as e:
+            self.logger.error(f"Error actualizando stock: {e}")
+            show_error_message("Error", f"Error actualizando stock: {str(e)}", dialog)
+    
+    def _apply_stock_update(self, insumo_id: int, nueva_cantidad: int, motivo: str):
+        """Encola el nuevo stock y actualiza la UI (los errores los maneja _save_stock_update)"""
+        self._stock_rollback.setdefault(insumo_id, self.form_cantidad_actual.get())
+        self._queue_stock_update(insumo_id, nueva_cantidad, motivo)
+        
+        # Reflejar el cambio en el formulario de inmediato (se revierte si el
+        # lote falla; la acción se registra cuando el lote se confirma)
+        self.form_cantidad_actual.set(nueva_cantidad)
+        self._update_stock_status_display()
+        
+        # Cerrar diálogo
+        self._hide_stock_dialog()
+    
+    def _queue_stock_update(self, insumo_id: int, nueva_cantidad: int, motivo: str):
+        """Encola una actualización de stock y reprograma el envío en lote"""
+        self._stock_update_queue.append((insumo_id, nueva_cantidad, motivo))
+        
+        if self._flush_job is not None:
+            self.frame.after_cancel(self._flush_job)
+        self._flush_job = self.frame.after(self._STOCK_FLUSH_DELAY_MS, self._flush_stock_updates)
+    
+    def _flush_stock_updates(self):
+        """Envía a la base de datos las actualizaciones de stock pendientes"""
+        self._flush_job = None
+        if not self._stock_update_queue:
+            return
+        
+        batch = self._stock_update_queue
+        rollback = self._stock_rollback
+        self._stock_update_queue = []
+        self._stock_rollback = {}
+        
+        self._run_async(
+            micro_insumos.actualizar_stock_bulk, batch,
+            on_done=lambda future: self._on_stock_flush_done(future, rollback)
+        )
+    
+    def flush_pending_stock_updates(self):
+        """
+        Escribe ya las actualizaciones de stock pendientes y espera a que terminen.
+        
+        Para el cierre del tab o de la aplicación, cuando el after() del envío
+        en lote ya no llegaría a ejecutarse. También espera a los guardados y
+        eliminaciones ya enviados al executor, para que nadie cierre las
+        conexiones con una escritura en curso.
+        """
+        if self._flush_job is not None:
+            self.frame.after_cancel(self._flush_job)
+            self._flush_job = None
+        
+        if not self._stock_update_queue:
+            # Un solo worker: la tarea vacía termina después de las ya enviadas
+            self._executor.submit(lambda: None).result()
+            return
+        
+        batch = self._stock_update_queue
+        self._stock_update_queue = []
+        self._stock_rollback = {}
+        
+        try:
+            # Por el executor: las escrituras previas en curso se aplican antes
+            result = self._executor.submit(micro_insumos.actualizar_stock_bulk, batch).result()
+            self._log_stock_updates(result['cambios'])
+            for fallo in result['fallos']:
+                self.logger.error(f"Stock pendiente no guardado al cerrar (ID {fallo['insumo_id']}): {fallo['error']}")
+        except Exception as e:
+            self.logger.error(f"Error guardando stock pendiente al cerrar: {e}")
+    
+    @staticmethod
+    def _log_stock_updates(cambios: List[Dict[str, Any]]):
+        """Registra las actualizaciones de stock ya confirmadas"""
+        for cambio in cambios:
+            log_user_action("UPDATE_STOCK", "stock_updated",
+                          f"ID: {cambio['insumo_id']}, Cantidad: {cambio['cantidad_nueva']}")
+    
+    def _on_stock_flush_done(self, future, rollback: Dict[int, int]):
+        """Procesa el resultado del envío en lote de stock (en el hilo de Tk)"""
+        try:
+            result = future.result()
+            cambios = result['cambios']
+            fallos = result['fallos']
             
-            # Botones
-            buttons_frame = ttk.Frame(content)
-            buttons_frame.pack(fill=X, pady=(15, 0))
+            if cambios:
+                self._log_stock_updates(cambios)
+                
+                # Actualizar solo las filas afectadas
+                by_id = {insumo.get('id'): insumo for insumo in self.insumos_list}
+                with self._batch_ui():
+                    for cambio in cambios:
+                        insumo = by_id.get(cambio['insumo_id'])
+                        if insumo is not None:
+                            self._upsert_local_insumo(
+                                dict(insumo, cantidad_actual=cambio['cantidad_nueva'])
+                            )
             
-            def save_stock_update():
-                try:
-                    nueva_cantidad = new_stock_var.get()
-                    motivo = motivo_var.get() or "Actualización manual"
-                    
-                    if nueva_cantidad < 0:
-                        show_error_message("Error", "La cantidad no puede ser negativa", dialog)
-                        return
-                    
-                    insumo_id = int(self.form_id.get())
-                    result = micro_insumos.actualizar_stock(insumo_id, nueva_cantidad, motivo)
-                    
-                    if result['success']:
-                        # Actualizar formulario
-                        self.form_cantidad_actual.set(nueva_cantidad)
-                        self._update_stock_status_display()
-                        
-                        # Actualizar lista
-                        self.refresh_data()
-                        
-                        # Cerrar diálogo
-                        dialog.destroy()
-                        
-                        show_info_message(
-                            "Stock Actualizado",
-                            f"Stock actualizado de {result['cantidad_anterior']} a {result['cantidad_nueva']}",
-                            self.frame
-                        )
-                        
-                        log_user_action("UPDATE_STOCK", "stock_updated", 
-                                      f"ID: {insumo_id}, Cantidad: {nueva_cantidad}")
-                    
-                except Exception as e:
-                    self.logger.error(f"Error actualizando stock: {e}")
-                    show_error_message("Error", f"Error actualizando stock: {str(e)}", dialog)
+            if fallos:
+                # Los demás cambios del lote sí se aplicaron; revertir solo estos
+                self._rollback_stock_form(rollback, {fallo['insumo_id'] for fallo in fallos})
+                detalle = "\n".join(f"ID {fallo['insumo_id']}: {fallo['error']}" for fallo in fallos)
+                show_error_message("Error", f"{result['message']}\n\n{detalle}", self.frame)
+                
+                # Sincronizar la lista con la base de datos
+                with self._batch_ui():
+                    self.refresh_data()
             
-            ttk.Button(
-                buttons_frame,
-                text="💾 Actualizar Stock",
-                command=save_stock_update,
-                bootstyle="success"
-            ).pack(side=LEFT, padx=(0, 5))
+            elif len(cambios) == 1:
+                show_info_message(
+                    "Stock Actualizado",
+                    f"Stock actualizado de {cambios[0]['cantidad_anterior']} "
+                    f"a {cambios[0]['cantidad_nueva']}",
+                    self.frame
+                )
+            else:
+                show_info_message("Stock Actualizado", result['message'], self.frame)
             
-            ttk.Button(
-                buttons_frame,
-                text="❌ Cancelar",
-                command=dialog.destroy,
-                bootstyle="danger-outline"
-            ).pack(side=RIGHT)
+        except Exception as e:
+            self.logger.error(f"Error actualizando stock: {e}")
+            show_error_message("Error", f"Error actualizando stock: {str(e)}", self.frame)
             
-            # Bind Enter key
-            dialog.bind("<Return>", lambda e: save_stock_update())
-            dialog.bind("<Escape>", lambda e: dialog.destroy())
+            # No se guardó nada del lote
+            self._rollback_stock_form(rollback, rollback.keys())
             
-        except Exception as e:
-            self.logger.error(f"Error mostrando diálogo de stock: {e}")
-            show_error_message("Error", f"Error abriendo diálogo: {str(e)}", self.frame)
+            # Sincronizar la lista con la base de datos
+            with self._batch_ui():
+                self.refresh_data()
+    
+    def _rollback_stock_form(self, rollback: Dict[int, int], failed_ids):
+        """Devuelve el formulario a la cantidad previa si su insumo no se guardó"""
+        insumo_id = self.selected_insumo_id
+        if insumo_id in rollback and insumo_id in failed_ids:
+            self.form_cantidad_actual.set(rollback[insumo_id])
+            self._update_stock_status_display()
     
     def _delete_insumo(self):
         """Elimina el insumo seleccionado"""
-        if not self.selected_insumo:
+        if self.selected_insumo_id is None:
             return
         
         try:
@@ -1032,22 +1535,35 @@ class InsumosTab(LoggerMixin):
                 f"El insumo será marcado como inactivo pero se mantendrá en el historial.",
                 self.frame
             ):
-                insumo_id = int(self.form_id.get())
-                result = micro_insumos.eliminar_insumo(insumo_id, soft_delete=True)
+                insumo_id = self.selected_insumo_id
+                self._run_async(
+                    micro_insumos.eliminar_insumo, insumo_id, True,
+                    on_done=lambda future: self._on_delete_done(future, insumo_id)
+                )
+            
+        except Exception as e:
+            self.logger.error(f"Error eliminando insumo: {e}")
+            show_error_message("Error", f"Error eliminando insumo: {str(e)}", self.frame)
+    
+    def _on_delete_done(self, future, insumo_id: int):
+        """Procesa el resultado de la eliminación (en el hilo de Tk)"""
+        try:
+            result = future.result()
+            
+            if result['success']:
+                show_info_message("Insumo Eliminado", result['message'], self.frame)
                 
-                if result['success']:
-                    show_info_message("Insumo Eliminado", result['message'], self.frame)
-                    
-                    # Actualizar lista y limpiar formulario
-                    self.refresh_data()
+                # Quitar la fila y limpiar formulario
+                with self._batch_ui():
+                    self._remove_local_insumo(insumo_id)
                     self._clear_form()
-                    
-                    log_user_action("DELETE_INSUMO", "insumo_deleted", f"ID: {insumo_id}")
-                    
-                    if hasattr(self.app, 'update_status'):
-                        self.app.update_status("Insumo eliminado", "success")
-                else:
-                    show_error_message("Error", "No se pudo eliminar el insumo", self.frame)
+                
+                log_user_action("DELETE_INSUMO", "insumo_deleted", f"ID: {insumo_id}")
+                
+                if hasattr(self.app, 'update_status'):
+                    self.app.update_status("Insumo eliminado", "success")
+            else:
+                show_error_message("Error", "No se pudo eliminar el insumo", self.frame)
             
         except Exception as e:
             self.logger.error(f"Error eliminando insumo: {e}")
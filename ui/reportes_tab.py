@@ -5,11 +5,11 @@ Interfaz para generar, visualizar y gestionar reportes del sistema
 
 import tkinter as tk
 from tkinter import messagebox
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Dict, Any, List, Optional
 from datetime import datetime, date, timedelta
-from pathlib import Path
 import os
-import subprocess
 
 try:
     import ttkbootstrap as ttk
@@ -23,20 +23,57 @@ from services.reportes_service import reportes_service
 from utils.logger import LoggerMixin, log_user_action
 from utils.helpers import (
     format_date, show_error_message, show_info_message,
-    ask_yes_no
+    ask_yes_no, open_in_desktop
 )
 from config.config_manager import config
 
 
+# Formatos aceptados al leer la fecha escrita en un DateEntry
+_DATE_TEXT_FORMATS = ("%d/%m/%Y", "%Y-%m-%d", "%m/%d/%Y")
+
+# Campos de un reporte que se muestran en el tree (extraídos en una sola llamada)
+_REPORT_ROW_FIELDS = itemgetter(
+    'filepath', 'icon', 'filename', 'type', 'format', 'size_display',
+    'created_display', 'modified_display'
+)
+
+
 class ReportesTab(LoggerMixin):
     """
     Tab para gestión completa de reportes del sistema
     """
     
+    # Intervalo de sondeo (ms) de las generaciones en segundo plano
+    _ASYNC_POLL_MS = 100
+    
+    # Columnas del tree de reportes: (nombre, ancho)
+    _TREE_COLUMNS = (
+        ("Tipo", 80),
+        ("Formato", 60),
+        ("Tamaño", 70),
+        ("Fecha Creación", 120),
+        ("Fecha Modificación", 120),
+    )
+    
+    # Tags zebra por paridad de fila
+    _ZEBRA_TAGS = ("even", "odd")
+    
+    # Espera (ms) para agrupar varias solicitudes de actualización seguidas
+    _REFRESH_DEBOUNCE_MS = 150
+    
+    # Carga perezosa de la lista: filas por bloque y umbral de scroll para pedir más
+    _PAGE_SIZE = 200
+    _LOAD_MORE_THRESHOLD = 0.9
+    
+    # A partir de cuántas filas nuevas se oculta el tree mientras se insertan
+    _BULK_INSERT_THRESHOLD = 50
+    
     def __init__(self, parent, app_instance):
         super().__init__()
         self.parent = parent
         self.app = app_instance
+        # Barra de estado de la aplicación (no-op si la app no la expone)
+        self._update_status = getattr(self.app, 'update_status', lambda *args, **kwargs: None)
 
         # Crear frame principal
         self.frame = ttk.Frame(parent, padding="15")
@@ -49,10 +86,26 @@ class ReportesTab(LoggerMixin):
         self.reportes_list = []
         # Mapeo interno para almacenar datos completos por item del Treeview
         self._item_data = {}
+        # Fila del tree por ruta de reporte: filepath -> (item_id, (texto, valores, tag))
+        self._row_by_path = {}
+        # Rutas en el orden en que se muestran actualmente
+        self._displayed_paths = []
+        # Cantidad de reportes mostrados en el tree (crece al hacer scroll)
+        self._visible_limit = self._PAGE_SIZE
+        self._load_more_pending = False
+        # Último texto mostrado en el contador de reportes
+        self._last_stats_text = None
+        # Generación de reportes fuera del hilo de Tk
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="reportes_tab")
+        self._pending_generations = 0
+        # Actualización de la lista pendiente (ver refresh_data)
+        self._refresh_after_id = None
         
         # Crear interfaz
         self._create_interface()
         
+        self.frame.bind("<Destroy>", self._on_destroy, add="+")
+        
         # Cargar datos inicial
         self.refresh_data()
         
@@ -121,6 +174,13 @@ class ReportesTab(LoggerMixin):
         
         # Panel de configuración global
         self._create_global_config_section(reports_grid, 1, 1)
+        
+        # Progreso de generaciones en curso (visible solo mientras hay alguna)
+        self.generation_progress = ttk.Progressbar(
+            generation_frame,
+            mode="indeterminate",
+            bootstyle="success-striped"
+        )
     
     def _create_inventory_reports_section(self, parent, row, col):
         """Crea sección de reportes de inventario"""
@@ -142,21 +202,23 @@ class ReportesTab(LoggerMixin):
         ).pack(anchor="w", pady=2)
         
         # Botones
-        ttk.Button(
+        self.inventory_pdf_btn = ttk.Button(
             inv_frame,
             text="📄 Generar PDF",
             command=self._generate_inventory_pdf,
             bootstyle="success",
             width=20
-        ).pack(fill=X, pady=2)
+        )
+        self.inventory_pdf_btn.pack(fill=X, pady=2)
         
-        ttk.Button(
+        self.inventory_excel_btn = ttk.Button(
             inv_frame,
             text="📊 Generar Excel",
             command=self._generate_inventory_excel,
             bootstyle="success-outline",
             width=20
-        ).pack(fill=X, pady=2)
+        )
+        self.inventory_excel_btn.pack(fill=X, pady=2)
     
     def _create_deliveries_reports_section(self, parent, row, col):
         """Crea sección de reportes de entregas"""
@@ -188,13 +250,14 @@ class ReportesTab(LoggerMixin):
         self.end_date.pack(fill=X, pady=(2, 10))
         
         # Botones
-        ttk.Button(
+        self.deliveries_btn = ttk.Button(
             del_frame,
             text="📄 Reporte del Período",
             command=self._generate_deliveries_pdf,
             bootstyle="info",
             width=20
-        ).pack(fill=X, pady=2)
+        )
+        self.deliveries_btn.pack(fill=X, pady=2)
     
     def _create_system_reports_section(self, parent, row, col):
         """Crea sección de reportes del sistema"""
@@ -207,21 +270,23 @@ class ReportesTab(LoggerMixin):
         sys_frame.grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
         
         # Botones de reportes del sistema
-        ttk.Button(
+        self.alerts_btn = ttk.Button(
             sys_frame,
             text="⚠️ Reporte de Alertas",
             command=self._generate_alerts_pdf,
             bootstyle="warning",
             width=20
-        ).pack(fill=X, pady=2)
+        )
+        self.alerts_btn.pack(fill=X, pady=2)
         
-        ttk.Button(
+        self.employees_btn = ttk.Button(
             sys_frame,
             text="👥 Reporte de Empleados",
             command=self._generate_employees_pdf,
             bootstyle="secondary",
             width=20
-        ).pack(fill=X, pady=2)
+        )
+        self.employees_btn.pack(fill=X, pady=2)
         
     
     def _create_global_config_section(self, parent, row, col):
@@ -304,34 +369,32 @@ class ReportesTab(LoggerMixin):
         list_content = ttk.Frame(list_frame)
         list_content.pack(fill=BOTH, expand=True)
         
-        columns = ["Tipo", "Formato", "Tamaño", "Fecha Creación", "Fecha Modificación"]
         self.reports_tree = ttk.Treeview(
             list_content,
-            columns=columns,
+            columns=[name for name, _ in self._TREE_COLUMNS],
             show="tree headings",
             bootstyle="info"
         )
         
+        # Estilos zebra (una sola vez al crear el tree)
+        self.reports_tree.tag_configure("even", background="#F7FAFF")
+        self.reports_tree.tag_configure("odd", background="#EDF3FF")
+        
         # Configurar columnas
         self.reports_tree.heading("#0", text="Nombre Archivo", anchor="w")
         self.reports_tree.column("#0", width=200, stretch=True)
         
-        for col in columns:
-            self.reports_tree.heading(col, text=col, anchor="center")
-        
-        self.reports_tree.column("Tipo", width=80, stretch=False)
-        self.reports_tree.column("Formato", width=60, stretch=False)
-        self.reports_tree.column("Tamaño", width=70, stretch=False)
-        self.reports_tree.column("Fecha Creación", width=120, stretch=False)
-        self.reports_tree.column("Fecha Modificación", width=120, stretch=False)
+        for name, width in self._TREE_COLUMNS:
+            self.reports_tree.heading(name, text=name, anchor="center")
+            self.reports_tree.column(name, width=width, stretch=False)
         
         # Scrollbar
-        reports_scrollbar = ttk.Scrollbar(list_content, orient=VERTICAL, command=self.reports_tree.yview)
-        self.reports_tree.configure(yscrollcommand=reports_scrollbar.set)
+        self.reports_scrollbar = ttk.Scrollbar(list_content, orient=VERTICAL, command=self.reports_tree.yview)
+        self.reports_tree.configure(yscrollcommand=self._on_tree_scroll)
         
         # Pack
         self.reports_tree.pack(side=LEFT, fill=BOTH, expand=True)
-        reports_scrollbar.pack(side=RIGHT, fill=Y)
+        self.reports_scrollbar.pack(side=RIGHT, fill=Y)
         
         # Menú contextual para reportes
         self._create_context_menu()
@@ -375,9 +438,22 @@ class ReportesTab(LoggerMixin):
             self.context_menu.post(event.x_root, event.y_root)
     
     def refresh_data(self, quick: bool = False):
+        """
+        Programa la actualización de la lista de reportes.
+        
+        Las solicitudes que llegan seguidas (varias generaciones que terminan
+        juntas, doble click en Actualizar) se agrupan en una sola lectura del
+        directorio y una sola actualización del tree.
+        """
+        if self._refresh_after_id is not None:
+            self.frame.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.frame.after(self._REFRESH_DEBOUNCE_MS, self._do_refresh, quick)
+    
+    def _do_refresh(self, quick: bool = False):
         """Actualiza la lista de reportes"""
+        self._refresh_after_id = None
         try:
-            self.logger.debug(f"Actualizando datos de reportes (quick={quick})")
+            self.logger.debug("Actualizando datos de reportes (quick=%s)", quick)
             
             # Obtener lista de reportes
             self.reportes_list = reportes_service.listar_reportes_disponibles()
@@ -388,117 +464,289 @@ class ReportesTab(LoggerMixin):
             self.logger.info("Datos de reportes actualizados")
             
         except Exception as e:
-            self.logger.error(f"Error actualizando datos de reportes: {e}")
-            if hasattr(self.app, 'update_status'):
-                self.app.update_status("Error cargando reportes", "danger")
+            self.logger.error("Error actualizando datos de reportes: %s", e)
+            self._update_status("Error cargando reportes", "danger")
     
     def _update_reports_tree(self):
-        """Actualiza el árbol de reportes"""
+        """
+        Actualiza el árbol de reportes.
+        
+        Reconcilia las filas existentes por ruta de archivo: solo inserta los
+        reportes nuevos, actualiza los que cambiaron y elimina los que ya no
+        existen, conservando los item_id (y con ello la selección actual).
+        Solo se muestran los primeros _visible_limit reportes (los más recientes);
+        el resto se agrega al acercarse al final del scroll.
+        """
         try:
-            # Limpiar tree
-            for item in self.reports_tree.get_children():
-                self.reports_tree.delete(item)
-            
-            # Resetear almacenamiento auxiliar
-            self._item_data = {}
-            
-            # Agregar reportes al tree (con zebra)
-            for idx, reporte in enumerate(self.reportes_list):
-                # Formatear fechas
-                fecha_creacion = datetime.fromisoformat(reporte['created_at']).strftime('%d/%m/%Y %H:%M')
-                fecha_modificacion = datetime.fromisoformat(reporte['modified_at']).strftime('%d/%m/%Y %H:%M')
-                
-                # Tag zebra
-                zebra_tag = "even" if idx % 2 == 0 else "odd"
-                
-                # Agregar item
-                item_id = self.reports_tree.insert(
-                    "", "end",
-                    text=f"{reporte['icon']} {reporte['filename']}",
-                    values=(
-                        reporte['type'],
-                        reporte['format'],
-                        f"{reporte['size_mb']:.2f} MB",
-                        fecha_creacion,
-                        fecha_modificacion
-                    ),
-                    tags=(zebra_tag,)
-                )
-                
-                # Guardar datos completos en un mapa auxiliar
-                self._item_data[item_id] = reporte
+            visible = self.reportes_list[:self._visible_limit]
+            new_paths = [reporte['filepath'] for reporte in visible]
+            
+            # Eliminar filas de reportes que ya no existen
+            removed = self._row_by_path.keys() - set(new_paths)
+            if removed:
+                removed_items = [self._row_by_path.pop(path)[0] for path in removed]
+                self.reports_tree.delete(*removed_items)
+                for item_id in removed_items:
+                    self._item_data.pop(item_id, None)
+            
+            # Si cambió el orden relativo de las filas que se conservan
+            # (p. ej. un reporte sobrescrito), hay que reubicarlas
+            kept_order = [path for path in new_paths if path in self._row_by_path]
+            reorder = kept_order != [
+                path for path in self._displayed_paths if path in self._row_by_path
+            ]
+            
+            # Con muchas filas nuevas (carga inicial, siguiente bloque) se saca
+            # el tree de la geometría para evitar recálculos por cada insert
+            bulk = len(new_paths) - len(kept_order) >= self._BULK_INSERT_THRESHOLD
+            if bulk:
+                self.reports_tree.pack_forget()
             
-            # Estilos zebra
             try:
-                self.reports_tree.tag_configure("even", background="#F7FAFF")
-                self.reports_tree.tag_configure("odd", background="#EDF3FF")
-            except Exception:
-                pass
+                self._sync_tree_rows(visible, reorder)
+            finally:
+                if bulk:
+                    self.reports_tree.pack(side=LEFT, fill=BOTH, expand=True, before=self.reports_scrollbar)
+            
+            self._displayed_paths = new_paths
             
             # Actualizar conteo
-            total_reportes = len(self.reportes_list)
-            self.reports_stats_label.config(text=f"Total: {total_reportes} reportes")
+            self._update_reports_count()
             
         except Exception as e:
-            self.logger.error(f"Error actualizando tree de reportes: {e}")
+            self.logger.error("Error actualizando tree de reportes: %s", e)
     
+    def _update_reports_count(self):
+        """Actualiza el contador de reportes mostrados/totales"""
+        shown = len(self._displayed_paths)
+        total_reportes = len(self.reportes_list)
+        if shown < total_reportes:
+            stats_text = f"Mostrando {shown}/{total_reportes} reportes"
+        else:
+            stats_text = f"Total: {total_reportes} reportes"
+        if stats_text != self._last_stats_text:
+            self.reports_stats_label.config(text=stats_text)
+            self._last_stats_text = stats_text
+    
+    def _append_report_row(self, result: Dict[str, Any]):
+        """
+        Agrega al tope de la lista el reporte recién generado.
+        
+        Inserta una sola fila (el tag zebra se elige opuesto al de la primera
+        fila actual para no recolorear las demás) en lugar de volver a listar
+        el directorio. Si el archivo ya estaba listado (sobrescrito) o no se
+        puede leer, se recurre a refresh_data().
+        """
+        filepath = result['filepath']
+        reporte = reportes_service.obtener_info_reporte(filepath) if filepath not in self._row_by_path else None
+        if reporte is None:
+            self.refresh_data()
+            return
+        
+        try:
+            filepath, icon, filename, rtype, fmt, size, created, modified = _REPORT_ROW_FIELDS(reporte)
+            
+            if self._displayed_paths:
+                first_tag = self._row_by_path[self._displayed_paths[0]][1][2]
+                zebra_tag = self._ZEBRA_TAGS[first_tag == self._ZEBRA_TAGS[0]]
+            else:
+                zebra_tag = self._ZEBRA_TAGS[0]
+            
+            display = (
+                f"{icon} {filename}",
+                (rtype, fmt, size, created, modified),
+                zebra_tag
+            )
+            item_id = self.reports_tree.insert(
+                "", 0,
+                text=display[0],
+                values=display[1],
+                tags=(zebra_tag,)
+            )
+            
+            # Un archivo sobrescrito fuera de la ventana visible no debe quedar duplicado
+            self.reportes_list = [reporte] + [r for r in self.reportes_list if r['filepath'] != filepath]
+            self._displayed_paths.insert(0, filepath)
+            self._visible_limit += 1
+            self._row_by_path[filepath] = (item_id, display)
+            self._item_data[item_id] = reporte
+            
+            self._update_reports_count()
+            
+        except Exception as e:
+            self.logger.error("Error agregando reporte al tree: %s", e)
+            self.refresh_data()
+    
+    def _sync_tree_rows(self, visible: List[Dict[str, Any]], reorder: bool):
+        """Inserta/actualiza las filas visibles del tree en su posición"""
+        zebra_tags = self._ZEBRA_TAGS
+        row_by_path = self._row_by_path
+        
+        # Agregar/actualizar reportes en el tree (con zebra)
+        for idx, reporte in enumerate(visible):
+            filepath, icon, filename, rtype, fmt, size, created, modified = _REPORT_ROW_FIELDS(reporte)
+            
+            # Tag zebra
+            zebra_tag = zebra_tags[idx & 1]
+            
+            display = (
+                f"{icon} {filename}",
+                (rtype, fmt, size, created, modified),
+                zebra_tag
+            )
+            
+            row = row_by_path.get(filepath)
+            if row is None:
+                # Reporte nuevo
+                item_id = self.reports_tree.insert(
+                    "", idx,
+                    text=display[0],
+                    values=display[1],
+                    tags=(zebra_tag,)
+                )
+            else:
+                item_id, previous = row
+                if previous != display:
+                    self.reports_tree.item(
+                        item_id,
+                        text=display[0],
+                        values=display[1],
+                        tags=(zebra_tag,)
+                    )
+                if reorder:
+                    self.reports_tree.move(item_id, "", idx)
+            
+            row_by_path[filepath] = (item_id, display)
+            # Guardar datos completos en un mapa auxiliar
+            self._item_data[item_id] = reporte
+    
+    def _on_tree_scroll(self, first, last):
+        """Sincroniza la scrollbar y pide más filas al acercarse al final"""
+        self.reports_scrollbar.set(first, last)
+        if (
+            float(last) > self._LOAD_MORE_THRESHOLD
+            and not self._load_more_pending
+            and self._visible_limit < len(self.reportes_list)
+        ):
+            # Fuera del callback de scroll para no reentrar en el tree
+            self._load_more_pending = True
+            self.frame.after_idle(self._load_more_reports)
+    
+    def _load_more_reports(self):
+        """Agrega el siguiente bloque de reportes al tree"""
+        self._load_more_pending = False
+        self._visible_limit += self._PAGE_SIZE
+        self._update_reports_tree()
     
     def _get_date_from_dateentry(self, widget) -> date:
         """
         Obtiene un objeto date desde un DateEntry de ttkbootstrap de forma segura.
         Soporta múltiples APIs (dateobj, get_date) y realiza parseo de texto como respaldo.
+        La vía que funciona se guarda en el widget y se usa directamente en las
+        siguientes llamadas (recorriendo de nuevo las alternativas solo si falla).
         """
+        resolver = getattr(widget, "_cached_date_resolver", None)
+        if resolver is not None:
+            try:
+                val = resolver()
+                if isinstance(val, date):
+                    return val
+            except Exception:
+                pass
+        
         # 1) API típica de ttkbootstrap: propiedad dateobj
         try:
             val = getattr(widget, "dateobj", None)
             if isinstance(val, date):
+                widget._cached_date_resolver = lambda: widget.dateobj
                 return val
         except Exception:
             pass
 
         # 2) Algunos builds exponen get_date()
         try:
-            return widget.get_date()
+            val = widget.get_date()
+            widget._cached_date_resolver = widget.get_date
+            return val
         except Exception:
             pass
 
         # 3) Respaldo: leer texto y parsear
-        text = ""
         try:
-            if hasattr(widget, "entry"):
-                text = widget.entry.get().strip()
-            else:
-                # Fallback para widgets con interfaz tipo Combobox
-                text = widget.get().strip()
+            val = self._parse_dateentry_text(widget)
+            widget._cached_date_resolver = lambda: self._parse_dateentry_text(widget)
+            return val
         except Exception:
-            text = ""
+            pass
 
-        for fmt in ("%d/%m/%Y", "%Y-%m-%d", "%m/%d/%Y"):
+        # 4) Último recurso: fecha actual
+        return date.today()
+    
+    @staticmethod
+    def _parse_dateentry_text(widget) -> date:
+        """Parsea el texto de un DateEntry (lanza ValueError si ningún formato aplica)"""
+        if hasattr(widget, "entry"):
+            text = widget.entry.get().strip()
+        else:
+            # Fallback para widgets con interfaz tipo Combobox
+            text = widget.get().strip()
+
+        for fmt in _DATE_TEXT_FORMATS:
             try:
                 return datetime.strptime(text, fmt).date()
-            except Exception:
+            except ValueError:
                 continue
-
-        # 4) Último recurso: fecha actual
-        return date.today()
+        raise ValueError(f"Fecha no reconocida: {text!r}")
+    
+    def _run_generation(self, button, error_context: str, on_result, func, *args, **kwargs):
+        """
+        Ejecuta la generación de un reporte en segundo plano.
+        
+        Deshabilita el botón que la inició y muestra la barra de progreso
+        mientras el servicio trabaja; on_result recibe el resultado en el hilo de Tk.
+        """
+        button.configure(state="disabled")
+        self._pending_generations += 1
+        if self._pending_generations == 1:
+            self.generation_progress.pack(fill=X, pady=(5, 0))
+            self.generation_progress.start()
+        
+        future = self._executor.submit(func, *args, **kwargs)
+        self._poll_future(future, button, error_context, on_result)
+    
+    def _poll_future(self, future, button, error_context: str, on_result):
+        """Espera (sin bloquear la UI) a que termine la generación"""
+        if not future.done():
+            self.frame.after(self._ASYNC_POLL_MS, self._poll_future, future, button, error_context, on_result)
+            return
+        
+        self._pending_generations -= 1
+        if self._pending_generations == 0:
+            self.generation_progress.stop()
+            self.generation_progress.pack_forget()
+        button.configure(state="normal")
+        
+        try:
+            on_result(future.result())
+        except Exception as e:
+            self.logger.error("Error generando %s: %s", error_context, e)
+            self._update_status("Error generando reporte", "danger")
+            show_error_message("Error", f"Error generando reporte: {str(e)}", self.frame)
+    
+    def _on_destroy(self, event):
+        """Libera el executor cuando se destruye el tab"""
+        if event.widget is self.frame:
+            self._executor.shutdown(wait=False)
+    
     # Manejadores de eventos para generación de reportes
     
     def _generate_inventory_pdf(self):
         """Genera reporte de inventario en PDF"""
         log_user_action("CLICK", "generate_inventory_pdf", "ReportesTab")
         
-        try:
-            if hasattr(self.app, 'update_status'):
-                self.app.update_status("Generando reporte de inventario PDF...")
-            
-            # Generar reporte
-            result = reportes_service.generar_reporte_inventario_pdf(
-                incluir_graficos=self.include_charts_var.get()
-            )
-            
+        def on_result(result):
             if result['success']:
-                if hasattr(self.app, 'update_status'):
-                    self.app.update_status("Reporte PDF generado", "success")
+                self._update_status("Reporte PDF generado", "success")
                 
                 show_info_message(
                     "Reporte Generado",
@@ -515,32 +763,34 @@ class ReportesTab(LoggerMixin):
                     self._open_file(result['filepath'])
                 
                 # Actualizar lista
-                self.refresh_data()
+                self._append_report_row(result)
                 
             else:
-                if hasattr(self.app, 'update_status'):
-                    self.app.update_status("Error generando reporte", "danger")
+                self._update_status("Error generando reporte", "danger")
                 show_error_message("Error", "No se pudo generar el reporte PDF", self.frame)
+        
+        try:
+            self._update_status("Generando reporte de inventario PDF...")
+            
+            # Generar reporte
+            self._run_generation(
+                self.inventory_pdf_btn, "reporte inventario PDF", on_result,
+                reportes_service.generar_reporte_inventario_pdf,
+                incluir_graficos=self.include_charts_var.get()
+            )
             
         except Exception as e:
-            self.logger.error(f"Error generando reporte inventario PDF: {e}")
-            if hasattr(self.app, 'update_status'):
-                self.app.update_status("Error generando reporte", "danger")
+            self.logger.error("Error generando reporte inventario PDF: %s", e)
+            self._update_status("Error generando reporte", "danger")
             show_error_message("Error", f"Error generando reporte: {str(e)}", self.frame)
     
     def _generate_inventory_excel(self):
         """Genera reporte de inventario en Excel"""
         log_user_action("CLICK", "generate_inventory_excel", "ReportesTab")
         
-        try:
-            if hasattr(self.app, 'update_status'):
-                self.app.update_status("Generando reporte de inventario Excel...")
-            
-            result = reportes_service.generar_reporte_inventario_excel()
-            
+        def on_result(result):
             if result['success']:
-                if hasattr(self.app, 'update_status'):
-                    self.app.update_status("Reporte Excel generado", "success")
+                self._update_status("Reporte Excel generado", "success")
                 
                 show_info_message(
                     "Reporte Generado",
@@ -555,12 +805,19 @@ class ReportesTab(LoggerMixin):
                 if ask_yes_no("Abrir Reporte", "¿Desea abrir el reporte generado?", self.frame):
                     self._open_file(result['filepath'])
                 
-                self.refresh_data()
+                self._append_report_row(result)
+        
+        try:
+            self._update_status("Generando reporte de inventario Excel...")
+            
+            self._run_generation(
+                self.inventory_excel_btn, "reporte inventario Excel", on_result,
+                reportes_service.generar_reporte_inventario_excel
+            )
                 
         except Exception as e:
-            self.logger.error(f"Error generando reporte inventario Excel: {e}")
-            if hasattr(self.app, 'update_status'):
-                self.app.update_status("Error generando reporte", "danger")
+            self.logger.error("Error generando reporte inventario Excel: %s", e)
+            self._update_status("Error generando reporte", "danger")
             show_error_message("Error", f"Error generando reporte: {str(e)}", self.frame)
     
     def _generate_deliveries_pdf(self):
@@ -588,76 +845,77 @@ class ReportesTab(LoggerMixin):
             
             if fmt == "EXCEL":
                 # Reporte de entregas en Excel
-                if hasattr(self.app, 'update_status'):
-                    self.app.update_status("Generando reporte de entregas Excel...")
+                self._update_status("Generando reporte de entregas Excel...")
                 
-                result = reportes_service.generar_reporte_entregas_excel(fecha_inicio, fecha_fin)
+                def on_result(result):
+                    if result.get('success'):
+                        self._update_status("Reporte de entregas Excel generado", "success")
+                        
+                        show_info_message(
+                            "Reporte de Entregas",
+                            f"Reporte generado:\n\n"
+                            f"📊 {result['filename']}\n"
+                            f"📅 Período: {fecha_inicio.strftime('%d/%m/%Y')} - {fecha_fin.strftime('%d/%m/%Y')}\n"
+                            f"📁 Tamaño: {result['size_mb']} MB\n"
+                            f"📄 Entregas incluidas: {result.get('total_entregas', 0)}\n\n"
+                            f"¿Desea abrir el reporte?",
+                            self.frame
+                        )
+                        
+                        if ask_yes_no("Abrir Reporte", "¿Desea abrir el reporte generado?", self.frame):
+                            self._open_file(result['filepath'])
+                        
+                        self._append_report_row(result)
+                    else:
+                        self._update_status("Error generando reporte", "danger")
+                        show_error_message(
+                            "Error",
+                            "No se pudo generar el reporte de entregas en Excel",
+                            self.frame
+                        )
                 
-                if result.get('success'):
-                    if hasattr(self.app, 'update_status'):
-                        self.app.update_status("Reporte de entregas Excel generado", "success")
-                    
-                    show_info_message(
-                        "Reporte de Entregas",
-                        f"Reporte generado:\n\n"
-                        f"📊 {result['filename']}\n"
-                        f"📅 Período: {fecha_inicio.strftime('%d/%m/%Y')} - {fecha_fin.strftime('%d/%m/%Y')}\n"
-                        f"📁 Tamaño: {result['size_mb']} MB\n"
-                        f"📄 Entregas incluidas: {result.get('total_entregas', 0)}\n\n"
-                        f"¿Desea abrir el reporte?",
-                        self.frame
-                    )
-                    
-                    if ask_yes_no("Abrir Reporte", "¿Desea abrir el reporte generado?", self.frame):
-                        self._open_file(result['filepath'])
-                    
-                    self.refresh_data()
-                else:
-                    if hasattr(self.app, 'update_status'):
-                        self.app.update_status("Error generando reporte", "danger")
-                    show_error_message(
-                        "Error",
-                        "No se pudo generar el reporte de entregas en Excel",
-                        self.frame
-                    )
+                self._run_generation(
+                    self.deliveries_btn, "reporte de entregas", on_result,
+                    reportes_service.generar_reporte_entregas_excel, fecha_inicio, fecha_fin
+                )
             else:
                 # Comportamiento original: PDF
-                if hasattr(self.app, 'update_status'):
-                    self.app.update_status("Generando reporte de entregas PDF...")
+                self._update_status("Generando reporte de entregas PDF...")
                 
-                result = reportes_service.generar_reporte_entregas_pdf(fecha_inicio, fecha_fin)
+                def on_result(result):
+                    if result.get('success'):
+                        self._update_status("Reporte de entregas PDF generado", "success")
+                        
+                        show_info_message(
+                            "Reporte Generado",
+                            f"Reporte de entregas creado:\n\n"
+                            f"📋 {result['filename']}\n"
+                            f"📅 Período: {fecha_inicio.strftime('%d/%m/%Y')} - {fecha_fin.strftime('%d/%m/%Y')}\n"
+                            f"📄 Entregas incluidas: {result.get('total_entregas', 0)}\n\n"
+                            f"¿Desea abrir el reporte?",
+                            self.frame
+                        )
+                        
+                        if ask_yes_no("Abrir Reporte", "¿Desea abrir el reporte generado?", self.frame):
+                            self._open_file(result['filepath'])
+                        
+                        self._append_report_row(result)
+                    else:
+                        self._update_status("Error generando reporte", "danger")
+                        show_error_message(
+                            "Error",
+                            "No se pudo generar el reporte de entregas en PDF",
+                            self.frame
+                        )
                 
-                if result.get('success'):
-                    if hasattr(self.app, 'update_status'):
-                        self.app.update_status("Reporte de entregas PDF generado", "success")
-                    
-                    show_info_message(
-                        "Reporte Generado",
-                        f"Reporte de entregas creado:\n\n"
-                        f"📋 {result['filename']}\n"
-                        f"📅 Período: {fecha_inicio.strftime('%d/%m/%Y')} - {fecha_fin.strftime('%d/%m/%Y')}\n"
-                        f"📄 Entregas incluidas: {result.get('total_entregas', 0)}\n\n"
-                        f"¿Desea abrir el reporte?",
-                        self.frame
-                    )
-                    
-                    if ask_yes_no("Abrir Reporte", "¿Desea abrir el reporte generado?", self.frame):
-                        self._open_file(result['filepath'])
-                    
-                    self.refresh_data()
-                else:
-                    if hasattr(self.app, 'update_status'):
-                        self.app.update_status("Error generando reporte", "danger")
-                    show_error_message(
-                        "Error",
-                        "No se pudo generar el reporte de entregas en PDF",
-                        self.frame
-                    )
+                self._run_generation(
+                    self.deliveries_btn, "reporte de entregas", on_result,
+                    reportes_service.generar_reporte_entregas_pdf, fecha_inicio, fecha_fin
+                )
         
         except Exception as e:
-            self.logger.error(f"Error generando reporte de entregas: {e}")
-            if hasattr(self.app, 'update_status'):
-                self.app.update_status("Error generando reporte", "danger")
+            self.logger.error("Error generando reporte de entregas: %s", e)
+            self._update_status("Error generando reporte", "danger")
             show_error_message("Error", f"Error generando reporte: {str(e)}", self.frame)
     
     def _generate_alerts_pdf(self):
@@ -672,75 +930,76 @@ class ReportesTab(LoggerMixin):
             
             if fmt == "EXCEL":
                 # Reporte de alertas en Excel
-                if hasattr(self.app, 'update_status'):
-                    self.app.update_status("Generando reporte de alertas Excel...")
+                self._update_status("Generando reporte de alertas Excel...")
                 
-                result = reportes_service.generar_reporte_alertas_excel()
+                def on_result(result):
+                    if result.get('success'):
+                        self._update_status("Reporte de alertas Excel generado", "success")
+                        
+                        show_info_message(
+                            "Reporte de Alertas",
+                            f"Reporte generado:\n\n"
+                            f"📊 {result['filename']}\n"
+                            f"📁 Tamaño: {result['size_mb']} MB\n"
+                            f"⚠️ Alertas incluidas: {result.get('total_alertas', 0)}\n\n"
+                            f"¿Desea abrir el reporte?",
+                            self.frame
+                        )
+                        
+                        if ask_yes_no("Abrir Reporte", "¿Desea abrir el reporte generado?", self.frame):
+                            self._open_file(result['filepath'])
+                        
+                        self._append_report_row(result)
+                    else:
+                        self._update_status("Error generando reporte", "danger")
+                        show_error_message(
+                            "Error",
+                            "No se pudo generar el reporte de alertas en Excel",
+                            self.frame
+                        )
                 
-                if result.get('success'):
-                    if hasattr(self.app, 'update_status'):
-                        self.app.update_status("Reporte de alertas Excel generado", "success")
-                    
-                    show_info_message(
-                        "Reporte de Alertas",
-                        f"Reporte generado:\n\n"
-                        f"📊 {result['filename']}\n"
-                        f"📁 Tamaño: {result['size_mb']} MB\n"
-                        f"⚠️ Alertas incluidas: {result.get('total_alertas', 0)}\n\n"
-                        f"¿Desea abrir el reporte?",
-                        self.frame
-                    )
-                    
-                    if ask_yes_no("Abrir Reporte", "¿Desea abrir el reporte generado?", self.frame):
-                        self._open_file(result['filepath'])
-                    
-                    self.refresh_data()
-                else:
-                    if hasattr(self.app, 'update_status'):
-                        self.app.update_status("Error generando reporte", "danger")
-                    show_error_message(
-                        "Error",
-                        "No se pudo generar el reporte de alertas en Excel",
-                        self.frame
-                    )
+                self._run_generation(
+                    self.alerts_btn, "reporte de alertas", on_result,
+                    reportes_service.generar_reporte_alertas_excel
+                )
             else:
                 # Comportamiento original: PDF
-                if hasattr(self.app, 'update_status'):
-                    self.app.update_status("Generando reporte de alertas PDF...")
+                self._update_status("Generando reporte de alertas PDF...")
                 
-                result = reportes_service.generar_reporte_alertas_pdf()
+                def on_result(result):
+                    if result.get('success'):
+                        self._update_status("Reporte de alertas PDF generado", "success")
+                        
+                        show_info_message(
+                            "Reporte Generado",
+                            f"Reporte de alertas creado:\n\n"
+                            f"⚠️ {result['filename']}\n"
+                            f"📊 Alertas incluidas: {result.get('total_alertas', 0)}\n"
+                            f"🔴 Críticas: {result.get('alertas_criticas', 0)}\n\n"
+                            f"¿Desea abrir el reporte?",
+                            self.frame
+                        )
+                        
+                        if ask_yes_no("Abrir Reporte", "¿Desea abrir el reporte generado?", self.frame):
+                            self._open_file(result['filepath'])
+                        
+                        self._append_report_row(result)
+                    else:
+                        self._update_status("Error generando reporte", "danger")
+                        show_error_message(
+                            "Error",
+                            "No se pudo generar el reporte de alertas en PDF",
+                            self.frame
+                        )
                 
-                if result.get('success'):
-                    if hasattr(self.app, 'update_status'):
-                        self.app.update_status("Reporte de alertas PDF generado", "success")
-                    
-                    show_info_message(
-                        "Reporte Generado",
-                        f"Reporte de alertas creado:\n\n"
-                        f"⚠️ {result['filename']}\n"
-                        f"📊 Alertas incluidas: {result.get('total_alertas', 0)}\n"
-                        f"🔴 Críticas: {result.get('alertas_criticas', 0)}\n\n"
-                        f"¿Desea abrir el reporte?",
-                        self.frame
-                    )
-                    
-                    if ask_yes_no("Abrir Reporte", "¿Desea abrir el reporte generado?", self.frame):
-                        self._open_file(result['filepath'])
-                    
-                    self.refresh_data()
-                else:
-                    if hasattr(self.app, 'update_status'):
-                        self.app.update_status("Error generando reporte", "danger")
-                    show_error_message(
-                        "Error",
-                        "No se pudo generar el reporte de alertas en PDF",
-                        self.frame
-                    )
+                self._run_generation(
+                    self.alerts_btn, "reporte de alertas", on_result,
+                    reportes_service.generar_reporte_alertas_pdf
+                )
         
         except Exception as e:
-            self.logger.error(f"Error generando reporte de alertas: {e}")
-            if hasattr(self.app, 'update_status'):
-                self.app.update_status("Error generando reporte", "danger")
+            self.logger.error("Error generando reporte de alertas: %s", e)
+            self._update_status("Error generando reporte", "danger")
             show_error_message("Error", f"Error generando reporte: {str(e)}", self.frame)
     
     def _generate_employees_pdf(self):
@@ -748,54 +1007,56 @@ class ReportesTab(LoggerMixin):
         log_user_action("CLICK", "generate_employees_report", "ReportesTab")
         try:
             fmt = (self.format_var.get() or "PDF").upper()
-            if hasattr(self.app, 'update_status'):
-                self.app.update_status(f"Generando reporte de empleados {fmt}...")
+            self._update_status(f"Generando reporte de empleados {fmt}...")
             if fmt == "EXCEL":
-                result = reportes_service.generar_reporte_empleados_excel()
-                if result.get('success'):
-                    if hasattr(self.app, 'update_status'):
-                        self.app.update_status("Reporte de empleados Excel generado", "success")
-                    show_info_message(
-                        "Reporte de Empleados",
-                        f"Reporte generado:\n\n"
-                        f"📊 {result['filename']}\n"
-                        f"📁 Tamaño: {result['size_mb']} MB\n"
-                        f"👥 Empleados: {result.get('total_empleados', 0)}\n\n"
-                        f"¿Desea abrir el reporte?",
-                        self.frame
-                    )
-                    if ask_yes_no("Abrir Reporte", "¿Desea abrir el reporte generado?", self.frame):
-                        self._open_file(result['filepath'])
-                    self.refresh_data()
-                else:
-                    if hasattr(self.app, 'update_status'):
-                        self.app.update_status("Error generando reporte", "danger")
-                    show_error_message("Error", "No se pudo generar el reporte de empleados en Excel", self.frame)
+                def on_result(result):
+                    if result.get('success'):
+                        self._update_status("Reporte de empleados Excel generado", "success")
+                        show_info_message(
+                            "Reporte de Empleados",
+                            f"Reporte generado:\n\n"
+                            f"📊 {result['filename']}\n"
+                            f"📁 Tamaño: {result['size_mb']} MB\n"
+                            f"👥 Empleados: {result.get('total_empleados', 0)}\n\n"
+                            f"¿Desea abrir el reporte?",
+                            self.frame
+                        )
+                        if ask_yes_no("Abrir Reporte", "¿Desea abrir el reporte generado?", self.frame):
+                            self._open_file(result['filepath'])
+                        self._append_report_row(result)
+                    else:
+                        self._update_status("Error generando reporte", "danger")
+                        show_error_message("Error", "No se pudo generar el reporte de empleados en Excel", self.frame)
+                self._run_generation(
+                    self.employees_btn, "reporte de empleados", on_result,
+                    reportes_service.generar_reporte_empleados_excel
+                )
             else:
-                result = reportes_service.generar_reporte_empleados_pdf()
-                if result.get('success'):
-                    if hasattr(self.app, 'update_status'):
-                        self.app.update_status("Reporte de empleados PDF generado", "success")
-                    show_info_message(
-                        "Reporte de Empleados",
-                        f"Reporte generado:\n\n"
-                        f"📄 {result['filename']}\n"
-                        f"📁 Tamaño: {result['size_mb']} MB\n"
-                        f"👥 Empleados: {result.get('total_empleados', 0)}\n\n"
-                        f"¿Desea abrir el reporte?",
-                        self.frame
-                    )
-                    if ask_yes_no("Abrir Reporte", "¿Desea abrir el reporte generado?", self.frame):
-                        self._open_file(result['filepath'])
-                    self.refresh_data()
-                else:
-                    if hasattr(self.app, 'update_status'):
-                        self.app.update_status("Error generando reporte", "danger")
-                    show_error_message("Error", "No se pudo generar el reporte de empleados en PDF", self.frame)
+                def on_result(result):
+                    if result.get('success'):
+                        self._update_status("Reporte de empleados PDF generado", "success")
+                        show_info_message(
+                            "Reporte de Empleados",
+                            f"Reporte generado:\n\n"
+                            f"📄 {result['filename']}\n"
+                            f"📁 Tamaño: {result['size_mb']} MB\n"
+                            f"👥 Empleados: {result.get('total_empleados', 0)}\n\n"
+                            f"¿Desea abrir el reporte?",
+                            self.frame
+                        )
+                        if ask_yes_no("Abrir Reporte", "¿Desea abrir el reporte generado?", self.frame):
+                            self._open_file(result['filepath'])
+                        self._append_report_row(result)
+                    else:
+                        self._update_status("Error generando reporte", "danger")
+                        show_error_message("Error", "No se pudo generar el reporte de empleados en PDF", self.frame)
+                self._run_generation(
+                    self.employees_btn, "reporte de empleados", on_result,
+                    reportes_service.generar_reporte_empleados_pdf
+                )
         except Exception as e:
-            self.logger.error(f"Error generando reporte de empleados: {e}")
-            if hasattr(self.app, 'update_status'):
-                self.app.update_status("Error generando reporte", "danger")
+            self.logger.error("Error generando reporte de empleados: %s", e)
+            self._update_status("Error generando reporte", "danger")
             show_error_message("Error", f"Error generando reporte: {str(e)}", self.frame)
     
     
@@ -817,34 +1078,30 @@ class ReportesTab(LoggerMixin):
                 show_error_message("Error", "No se pudo obtener la ruta del archivo", self.frame)
                 return
             
-            log_user_action("OPEN_REPORT", "open_selected", f"Archivo: {Path(filepath).name}")
+            log_user_action("OPEN_REPORT", "open_selected", f"Archivo: {os.path.basename(filepath)}")
             
             self._open_file(filepath)
             
         except Exception as e:
-            self.logger.error(f"Error abriendo reporte: {e}")
+            self.logger.error("Error abriendo reporte: %s", e)
             show_error_message("Error", f"Error abriendo reporte: {str(e)}", self.frame)
     
     def _open_file(self, filepath: str):
         """Abre un archivo con la aplicación por defecto del sistema"""
         try:
-            if not Path(filepath).exists():
+            if not os.path.exists(filepath):
                 show_error_message("Error", "El archivo no existe", self.frame)
                 return
             
             # Abrir con aplicación por defecto según el SO
-            if os.name == 'nt':  # Windows
-                os.startfile(filepath)
-            elif os.name == 'posix':  # macOS y Linux
-                subprocess.run(['open', filepath] if sys.platform == 'darwin' else ['xdg-open', filepath])
+            open_in_desktop(filepath)
             
-            self.logger.info(f"Archivo abierto: {Path(filepath).name}")
+            self.logger.info("Archivo abierto: %s", os.path.basename(filepath))
             
         except Exception as e:
-            self.logger.error(f"Error abriendo archivo {filepath}: {e}")
+            self.logger.error("Error abriendo archivo %s: %s", filepath, e)
             show_error_message("Error", f"Error abriendo archivo: {str(e)}", self.frame)
     
-    
     def _delete_selected_report(self):
         """Elimina el reporte seleccionado"""
         selection = self.reports_tree.selection()
@@ -854,9 +1111,13 @@ class ReportesTab(LoggerMixin):
             return
         
         try:
-            # Obtener información del archivo
+            # Obtener nombre del archivo desde almacenamiento auxiliar
             selected_item = selection[0]
-            filename = self.reports_tree.item(selected_item, "text").split(" ", 1)[1]  # Remover emoji
+            filename = self._item_data.get(selected_item, {}).get("filename")
+            
+            if not filename:
+                show_error_message("Error", "No se pudo obtener el nombre del archivo", self.frame)
+                return
             
             # Confirmar eliminación
             if ask_yes_no(
@@ -876,7 +1137,7 @@ class ReportesTab(LoggerMixin):
                     show_error_message("Error", result['message'], self.frame)
             
         except Exception as e:
-            self.logger.error(f"Error eliminando reporte: {e}")
+            self.logger.error("Error eliminando reporte: %s", e)
             show_error_message("Error", f"Error eliminando reporte: {str(e)}", self.frame)
     
     def _open_reports_directory(self):
@@ -890,13 +1151,10 @@ class ReportesTab(LoggerMixin):
                 reports_dir.mkdir(parents=True, exist_ok=True)
             
             # Abrir directorio según el SO
-            if os.name == 'nt':  # Windows
-                os.startfile(str(reports_dir))
-            elif os.name == 'posix':  # macOS y Linux
-                subprocess.run(['open', str(reports_dir)] if sys.platform == 'darwin' else ['xdg-open', str(reports_dir)])
+            open_in_desktop(str(reports_dir))
             
-            self.logger.info(f"Directorio de reportes abierto: {reports_dir}")
+            self.logger.info("Directorio de reportes abierto: %s", reports_dir)
             
         except Exception as e:
-            self.logger.error(f"Error abriendo directorio de reportes: {e}")
+            self.logger.error("Error abriendo directorio de reportes: %s", e)
             show_error_message("Error", f"Error abriendo directorio: {str(e)}", self.frame)
\ No newline at end of file
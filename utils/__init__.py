@@ -3,14 +3,23 @@ DelegInsumos - Utilidades del Sistema
 Módulo de utilidades compartidas para el sistema DelegInsumos
 """
 
-import re
 import datetime
 import random
 import string
+from functools import singledispatch
 from typing import Optional
 from utils.helpers import generar_id as _helpers_generar_id
 
 
+# Tabla de bytes para prefijos de archivo: todo lo que no sea [a-zA-Z0-9_-] -> '_'
+_SAFE_PREFIX_BYTES = bytes(
+    b if chr(b) in (string.ascii_letters + string.digits + "_-") else ord("_")
+    for b in range(256)
+)
+
+_FROMISO = datetime.datetime.fromisoformat
+
+
 def safe_filename(prefix: str = "backup") -> str:
     """
     Genera un nombre de archivo seguro para backups.
@@ -22,7 +31,9 @@ def safe_filename(prefix: str = "backup") -> str:
         Nombre de archivo seguro con timestamp
     """
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_prefix = re.sub(r'[^a-zA-Z0-9_-]', '_', prefix)
+    # Cada carácter no ASCII se codifica como un único '?' y luego se
+    # reemplaza, igual que con una expresión regular por carácter
+    safe_prefix = prefix.encode('ascii', 'replace').translate(_SAFE_PREFIX_BYTES).decode('ascii')
     return f"{safe_prefix}_{timestamp}.db"
 
 
@@ -49,6 +60,36 @@ def generar_id(prefijo: str, longitud: int = 6) -> str:
 
 
 # Funciones de compatibilidad para widgets DateEntry
+def _is_date_entry(entry_widget) -> bool:
+    """Indica si el widget es un DateEntry, cacheando el resultado en el propio widget."""
+    try:
+        return entry_widget._is_date_entry
+    except AttributeError:
+        is_date_entry = hasattr(entry_widget, 'get_date')
+        try:
+            entry_widget._is_date_entry = is_date_entry
+        except AttributeError:
+            # Objetos con __slots__: no se puede cachear, se recalcula
+            pass
+        return is_date_entry
+
+
+@singledispatch
+def _to_date(value):
+    """Convierte un valor a date para DateEntry (por defecto se usa tal cual)."""
+    return value
+
+
+@_to_date.register
+def _(value: str):
+    return _FROMISO(value.replace('Z', '+00:00')).date()
+
+
+@_to_date.register
+def _(value: datetime.datetime):
+    return value.date()
+
+
 def set_date_entry_value(entry_widget, date_value):
     """
     Establece el valor de un widget de fecha de forma compatible.
@@ -58,18 +99,11 @@ def set_date_entry_value(entry_widget, date_value):
         date_value: Valor de fecha (date, datetime o string)
     """
     try:
-        # Intentar como DateEntry primero
-        if hasattr(entry_widget, 'set_date'):
-            if isinstance(date_value, str):
-                date_obj = datetime.datetime.fromisoformat(date_value.replace('Z', '+00:00')).date()
-            elif isinstance(date_value, datetime.datetime):
-                date_obj = date_value.date()
-            else:
-                date_obj = date_value
-            entry_widget.set_date(date_obj)
+        if _is_date_entry(entry_widget):
+            entry_widget.set_date(_to_date(date_value))
         else:
-            # Como Entry normal
-            if isinstance(date_value, (datetime.date, datetime.datetime)):
+            # Como Entry normal (datetime es subclase de date)
+            if isinstance(date_value, datetime.date):
                 date_str = date_value.strftime('%Y-%m-%d')
             else:
                 date_str = str(date_value)
@@ -81,27 +115,27 @@ def set_date_entry_value(entry_widget, date_value):
         entry_widget.insert(0, str(date_value))
 
 
-def get_date_entry_value(entry_widget):
+def get_date_entry_value(entry_widget, today: Optional[datetime.date] = None):
     """
     Obtiene el valor de un widget de fecha de forma compatible.
 
     Args:
         entry_widget: Widget Entry o DateEntry
+        today: Fecha por defecto ya calculada (útil al leer varios widgets
+            seguidos); si no se indica se usa la fecha actual
 
     Returns:
         Valor de fecha como objeto date
     """
     try:
         # Intentar como DateEntry primero
-        if hasattr(entry_widget, 'get_date'):
+        if _is_date_entry(entry_widget):
             return entry_widget.get_date()
-        else:
-            # Como Entry normal
-            date_str = entry_widget.get().strip()
-            if date_str:
-                return datetime.datetime.fromisoformat(date_str).date()
-            else:
-                return datetime.date.today()
+        # Como Entry normal
+        date_str = entry_widget.get().strip()
+        if date_str:
+            return _FROMISO(date_str).date()
     except Exception:
-        # Fallback: fecha actual
-        return datetime.date.today()
\ No newline at end of file
+        pass
+    # Fallback: fecha actual
+    return today if today is not None else datetime.date.today()
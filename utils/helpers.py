@@ -6,21 +6,59 @@ Funciones auxiliares para uso general en todo el sistema
 import os
 import shutil
 import random
+import sys
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Sequence, Union
 import tkinter as tk
 from tkinter import messagebox, filedialog
 import json
+import math
+import re
+from fnmatch import fnmatch
+from functools import lru_cache
 
+# orjson (opcional) codifica/decodifica JSON en C; sin él se usa json estándar
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+
+# Formatos de format_date por tipo (tipo desconocido -> "short")
+_DATE_FORMATS = {
+    "short": "%d/%m/%Y",
+    "long": "%d de %B de %Y",
+    "iso": "%Y-%m-%d",
+    "datetime": "%d/%m/%Y %H:%M",
+}
+
+
+# Formatos soportados por parse_date (además de la vía rápida ISO)
+_PARSE_DATE_FORMATS = (
+    "%d/%m/%Y",          # 15/01/2024
+    "%d-%m-%Y",          # 15-01-2024
+    "%Y-%m-%d",          # 2024-1-5 (ISO sin ceros a la izquierda)
+    "%Y-%m-%d %H:%M:%S"  # 2024-1-5 14:30:00
+)
+
+
+# Caracteres no permitidos en nombres de archivo -> '_'
+_UNSAFE_FILENAME_CHARS = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+
+@lru_cache(maxsize=4096)
 def format_date(date_obj: Optional[datetime], format_type: str = "short") -> str:
     """
     Formatea una fecha según el tipo especificado.
     
+    Los resultados se memorizan por (fecha, tipo): las mismas fechas se
+    formatean repetidamente al refrescar listas y reportes.
+    
     Args:
         date_obj: Objeto datetime a formatear
-        format_type: Tipo de formato ("short", "long", "iso")
+        format_type: Tipo de formato ("short", "long", "iso", "datetime")
         
     Returns:
         Fecha formateada como string
@@ -28,16 +66,31 @@ def format_date(date_obj: Optional[datetime], format_type: str = "short") -> str
     if not date_obj:
         return ""
     
-    if format_type == "short":
-        return date_obj.strftime("%d/%m/%Y")
-    elif format_type == "long":
-        return date_obj.strftime("%d de %B de %Y")
-    elif format_type == "iso":
-        return date_obj.strftime("%Y-%m-%d")
-    elif format_type == "datetime":
-        return date_obj.strftime("%d/%m/%Y %H:%M")
+    return date_obj.strftime(_DATE_FORMATS.get(format_type, _DATE_FORMATS["short"]))
+
+
+def _is_plain_iso(text: str) -> bool:
+    """
+    Indica si text tiene exactamente la forma "YYYY-MM-DD" o "YYYY-MM-DD HH:MM:SS".
+    
+    Todos los campos son dígitos: así fromisoformat no acepta zonas horarias
+    ("14:30+05"), fracciones ("14.5") ni otras variantes de su gramática.
+    """
+    length = len(text)
+    if length == 10:
+        time_ok = True
+    elif length == 19:
+        time_ok = (
+            text[10] == ' ' and text[13] == ':' and text[16] == ':'
+            and text[11:13].isdigit() and text[14:16].isdigit() and text[17:19].isdigit()
+        )
     else:
-        return date_obj.strftime("%d/%m/%Y")
+        return False
+    
+    return (
+        time_ok and text[4] == '-' and text[7] == '-'
+        and text[:4].isdigit() and text[5:7].isdigit() and text[8:10].isdigit()
+    )
 
 
 def parse_date(date_str: str) -> Optional[datetime]:
@@ -53,17 +106,20 @@ def parse_date(date_str: str) -> Optional[datetime]:
     if not date_str:
         return None
     
-    # Formatos soportados
-    formats = [
-        "%Y-%m-%d",        # 2024-01-15
-        "%d/%m/%Y",        # 15/01/2024
-        "%d-%m-%Y",        # 15-01-2024
-        "%Y-%m-%d %H:%M:%S"  # 2024-01-15 14:30:00
-    ]
+    text = date_str.strip()
+    
+    # Vía rápida para ISO (el caso más común): fromisoformat está en C y no
+    # depende del locale. Se limita a las dos formas ISO soportadas
+    # ("2024-01-15" y "2024-01-15 14:30:00") para no aceptar otras variantes.
+    if _is_plain_iso(text):
+        try:
+            return datetime.fromisoformat(text)
+        except ValueError:
+            pass
     
-    for fmt in formats:
+    for fmt in _PARSE_DATE_FORMATS:
         try:
-            return datetime.strptime(date_str.strip(), fmt)
+            return datetime.strptime(text, fmt)
         except ValueError:
             continue
     
@@ -80,12 +136,8 @@ def safe_filename(filename: str) -> str:
     Returns:
         Nombre de archivo seguro
     """
-    # Caracteres no permitidos en nombres de archivo
-    invalid_chars = '<>:"/\\|?*'
-    
-    safe_name = filename
-    for char in invalid_chars:
-        safe_name = safe_name.replace(char, '_')
+    # Caracteres no permitidos en nombres de archivo (una sola pasada)
+    safe_name = filename.translate(_UNSAFE_FILENAME_CHARS)
     
     # Remover espacios múltiples y al inicio/final
     safe_name = ' '.join(safe_name.split())
@@ -141,19 +193,31 @@ def cleanup_old_files(directory: str, max_age_days: int = 30,
     if not os.path.exists(directory):
         return 0
     
-    cutoff_date = datetime.now() - timedelta(days=max_age_days)
+    cutoff_ts = (datetime.now() - timedelta(days=max_age_days)).timestamp()
     deleted_count = 0
     
+    dir_fd = None
     try:
-        directory_path = Path(directory)
-        for file_path in directory_path.glob(file_pattern):
-            if file_path.is_file():
-                file_modified = datetime.fromtimestamp(file_path.stat().st_mtime)
-                if file_modified < cutoff_date:
-                    file_path.unlink()
+        # Donde el SO lo permite se abre el directorio una vez y stat/unlink
+        # se hacen relativos a él (fstatat/unlinkat), sin resolver la ruta
+        # completa en cada archivo; con dir_fd, entry.path es solo el nombre
+        if os.scandir in os.supports_fd and os.unlink in os.supports_dir_fd:
+            dir_fd = os.open(directory, os.O_RDONLY)
+        
+        # scandir entrega el tipo de cada entrada desde el propio directorio,
+        # así que solo se hace stat de los archivos que coinciden con el patrón
+        with os.scandir(directory if dir_fd is None else dir_fd) as entries:
+            for entry in entries:
+                if not fnmatch(entry.name, file_pattern) or not entry.is_file():
+                    continue
+                if entry.stat().st_mtime < cutoff_ts:
+                    os.unlink(entry.path, dir_fd=dir_fd)
                     deleted_count += 1
     except Exception as e:
         print(f"Error limpiando archivos antiguos: {e}")
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
     
     return deleted_count
 
@@ -209,6 +273,16 @@ def ask_yes_no(title: str, message: str, parent: tk.Widget = None) -> bool:
     return messagebox.askyesno(title, message, parent=parent)
 
 
+# Tipos de archivo para diálogos, precalculados por extensión
+_FILE_TYPES_DEFAULT = (("Todos los archivos", "*.*"),)
+_FILE_TYPES_BY_EXT = {
+    ".pdf": (("Archivos PDF", "*.pdf"), *_FILE_TYPES_DEFAULT),
+    ".xlsx": (("Archivos Excel", "*.xlsx"), *_FILE_TYPES_DEFAULT),
+    ".json": (("Archivos JSON", "*.json"), *_FILE_TYPES_DEFAULT),
+    ".db": (("Base de datos SQLite", "*.db"), *_FILE_TYPES_DEFAULT),
+}
+
+
 def select_save_file(title: str, initial_name: str = "", 
                     file_types: List[tuple] = None, 
                     parent: tk.Widget = None) -> Optional[str]:
@@ -218,14 +292,17 @@ def select_save_file(title: str, initial_name: str = "",
     Args:
         title: Título del diálogo
         initial_name: Nombre inicial sugerido
-        file_types: Lista de tipos de archivo [(descripción, extensión)]
+        file_types: Lista de tipos de archivo [(descripción, extensión)];
+            si no se indica se deduce de la extensión de initial_name
         parent: Widget padre (opcional)
         
     Returns:
         Ruta del archivo seleccionado o None si se canceló
     """
     if file_types is None:
-        file_types = [("Todos los archivos", "*.*")]
+        file_types = _FILE_TYPES_BY_EXT.get(
+            os.path.splitext(initial_name)[1].lower(), _FILE_TYPES_DEFAULT
+        )
     
     return filedialog.asksaveasfilename(
         title=title,
@@ -249,7 +326,7 @@ def select_open_file(title: str, file_types: List[tuple] = None,
         Ruta del archivo seleccionado o None si se canceló
     """
     if file_types is None:
-        file_types = [("Todos los archivos", "*.*")]
+        file_types = _FILE_TYPES_DEFAULT
     
     return filedialog.askopenfilename(
         title=title,
@@ -258,6 +335,22 @@ def select_open_file(title: str, file_types: List[tuple] = None,
     )
 
 
+def _get_screen_dims(window: tk.Misc) -> tuple:
+    """
+    Devuelve (ancho, alto) de la pantalla, cacheado en la raíz Tk.
+    
+    Cada winfo_screen* es una llamada al intérprete Tcl; la pantalla no cambia
+    durante la sesión, así que basta con consultarla una vez por raíz.
+    """
+    root = window._root()
+    try:
+        return root._screen_dims
+    except AttributeError:
+        dims = (window.winfo_screenwidth(), window.winfo_screenheight())
+        root._screen_dims = dims
+        return dims
+
+
 def center_window(window: tk.Toplevel, width: int, height: int, allow_resize: bool = True):
     """
     Centra una ventana en la pantalla y la hace responsive.
@@ -269,8 +362,7 @@ def center_window(window: tk.Toplevel, width: int, height: int, allow_resize: bo
         allow_resize: Si permitir redimensionamiento automático
     """
     # Obtener dimensiones de la pantalla
-    screen_width = window.winfo_screenwidth()
-    screen_height = window.winfo_screenheight()
+    screen_width, screen_height = _get_screen_dims(window)
 
     # Ajustar dimensiones si son demasiado grandes para la pantalla
     # Dejar un margen del 10% en cada lado
@@ -325,6 +417,56 @@ def truncate_text(text: str, max_length: int = 50, suffix: str = "...") -> str:
     return text[:max_length - len(suffix)] + suffix
 
 
+def _has_non_finite_float(data: Any) -> bool:
+    """Indica si hay algún float NaN/inf dentro de dicts, listas o tuplas"""
+    pending = [data]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            pending.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            pending.extend(value)
+    return False
+
+
+def _dumps_json(data: Any) -> bytes:
+    """
+    Serializa a JSON UTF-8 con sangría de 2 espacios (orjson si está disponible).
+    
+    orjson escribe NaN/inf como null y no admite enteros de más de 64 bits;
+    en esos casos se usa json estándar para no perder datos. Los floats con
+    exponente pueden escribirse distinto (1e20 frente a 1e+20), con el mismo valor.
+    """
+    if orjson is not None and not _has_non_finite_float(data):
+        try:
+            # Fechas y demás tipos no nativos pasan por str, igual que con json estándar
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            )
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+
+# 19+ dígitos seguidos: posible entero fuera de 64 bits, que orjson leería como float
+_LONG_DIGITS_RE = re.compile(rb'\d{19}')
+
+
+def _loads_json(content: bytes) -> Any:
+    """Decodifica JSON (orjson si está disponible; json estándar acepta además NaN/Infinity)"""
+    if orjson is not None and not _LONG_DIGITS_RE.search(content):
+        try:
+            return orjson.loads(content)
+        except ValueError:
+            pass
+    return json.loads(content.decode('utf-8'))
+
+
 def export_to_json(data: Dict[str, Any], filepath: str) -> bool:
     """
     Exporta datos a archivo JSON.
@@ -340,8 +482,8 @@ def export_to_json(data: Dict[str, Any], filepath: str) -> bool:
         # Crear directorio si no existe
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(filepath, 'w', encoding='utf-8') as file:
-            json.dump(data, file, indent=2, ensure_ascii=False, default=str)
+        with open(filepath, 'wb') as file:
+            file.write(_dumps_json(data))
         
         return True
     except Exception as e:
@@ -360,8 +502,9 @@ def import_from_json(filepath: str) -> Optional[Dict[str, Any]]:
         Datos importados o None si hubo error
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as file:
-            return json.load(file)
+        with open(filepath, 'rb') as file:
+            content = file.read()
+        return _loads_json(content)
     except Exception as e:
         print(f"Error importando desde JSON: {e}")
         return None
@@ -423,6 +566,63 @@ def get_stock_status(current: int, minimum: int, maximum: int) -> Dict[str, Any]
     }
 
 
+# Estados de stock indexados por el código que devuelve get_stock_status_batch
+# (el orden coincide con la prioridad de criticidad: crítico, bajo, exceso, normal)
+STOCK_STATUS_CODES = ("CRITICO", "BAJO", "EXCESO", "NORMAL")
+_STOCK_STATUS_COLORS = ("#F44336", "#FF9800", "#2196F3", "#4CAF50")
+_STOCK_STATUS_MESSAGES = (
+    "Sin stock disponible",
+    "Stock por debajo del mínimo",
+    "Stock por encima del máximo",
+    "Stock en nivel normal",
+)
+
+
+def get_stock_status_batch(current: Sequence[float], minimum: Sequence[float],
+                           maximum: Sequence[float]) -> Dict[str, Any]:
+    """
+    Versión vectorizada de get_stock_status para muchos insumos a la vez.
+    
+    Pensada para la generación de reportes: evalúa todas las filas en una
+    sola pasada con NumPy en lugar de construir un diccionario por insumo.
+    
+    Args:
+        current: Cantidades actuales
+        minimum: Cantidades mínimas
+        maximum: Cantidades máximas
+        
+    Returns:
+        Diccionario de columnas paralelas: code (índice en STOCK_STATUS_CODES),
+        status, color, message, percentage y needs_attention
+    """
+    import numpy as np  # Dependencia de pandas; solo se carga al generar reportes
+    
+    current = np.asarray(current, dtype=float)
+    minimum = np.asarray(minimum, dtype=float)
+    maximum = np.asarray(maximum, dtype=float)
+    
+    code = np.select(
+        [current <= 0, current <= minimum, current >= maximum],
+        [0, 1, 2],
+        default=3
+    ).astype(np.int8)
+    
+    percentage = np.minimum(
+        np.where(maximum > 0, current / np.where(maximum > 0, maximum, 1), 0.0),
+        1.0
+    )
+    
+    return {
+        "code": code,
+        "status": np.take(np.array(STOCK_STATUS_CODES, dtype=object), code),
+        "color": np.take(np.array(_STOCK_STATUS_COLORS, dtype=object), code),
+        "message": np.take(np.array(_STOCK_STATUS_MESSAGES, dtype=object), code),
+        "percentage": percentage,
+        # Solo se consideran alerta real: CRÍTICO / BAJO
+        "needs_attention": code <= 1
+    }
+
+
 def validate_positive_integer(value: str) -> Optional[int]:
     """
     Valida que un string sea un entero positivo.
@@ -440,6 +640,110 @@ def validate_positive_integer(value: str) -> Optional[int]:
         return None
 
 
+# Tamaño de bloque para copias en kernel (copy_file_range)
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> bool:
+    """
+    Copia size bytes entre descriptores sin pasar por espacio de usuario.
+    
+    Prueba copy_file_range (reflinks en sistemas con copy-on-write) y, si no
+    está disponible o falla a mitad (p. ej. entre sistemas de archivos en
+    kernels antiguos), continúa desde el mismo offset con sendfile.
+    
+    Returns:
+        True si se copiaron todos los bytes
+    """
+    offset = 0
+    
+    if hasattr(os, "copy_file_range"):
+        try:
+            while offset < size:
+                sent = os.copy_file_range(src_fd, dst_fd, _COPY_CHUNK_SIZE)
+                if not sent:
+                    # Algunos sistemas de archivos devuelven 0 sin copiar nada
+                    break
+                offset += sent
+        except OSError:
+            pass
+    
+    # sendfile entre archivos regulares solo está soportado en Linux
+    if offset < size and sys.platform.startswith("linux"):
+        try:
+            while offset < size:
+                sent = os.sendfile(dst_fd, src_fd, offset, _COPY_CHUNK_SIZE)
+                if not sent:
+                    break
+                offset += sent
+        except OSError:
+            pass
+    
+    return offset >= size
+
+
+def _resolve_copy_destination(source: str, destination: str) -> str:
+    """
+    Resuelve el destino de una copia igual que shutil.copy2.
+    
+    Un directorio destino se convierte en destino/basename(source), y copiar
+    un archivo sobre sí mismo se rechaza antes de abrir (y truncar) el destino.
+    
+    Raises:
+        shutil.SameFileError: Si fuente y destino son el mismo archivo
+    """
+    if os.path.isdir(destination):
+        destination = os.path.join(destination, os.path.basename(source))
+    
+    if os.path.exists(destination) and os.path.samefile(source, destination):
+        raise shutil.SameFileError(f"{source!r} and {destination!r} are the same file")
+    
+    return destination
+
+
+def fast_copy(source: str, destination: str, preserve_metadata: bool = False) -> str:
+    """
+    Copia un archivo sin pasar los datos por espacio de usuario.
+    
+    En Linux usa copy_file_range/sendfile directamente sobre descriptores;
+    si no es posible (u otro SO), usa shutil.copyfile, que ya aprovecha
+    fcopyfile/CopyFile2 según la plataforma.
+    
+    Args:
+        source: Archivo fuente
+        destination: Archivo o directorio destino
+        preserve_metadata: Si copiar también permisos y fechas (como copy2)
+        
+    Returns:
+        Ruta del archivo copiado
+        
+    Raises:
+        shutil.SameFileError: Si fuente y destino son el mismo archivo
+    """
+    # Antes de abrir con O_TRUNC: copiar un archivo sobre sí mismo lo vaciaría
+    destination = _resolve_copy_destination(source, destination)
+    
+    copied = False
+    if hasattr(os, "copy_file_range") or hasattr(os, "sendfile"):
+        src_fd = os.open(source, os.O_RDONLY)
+        try:
+            dst_fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                copied = _kernel_copy(src_fd, dst_fd, os.fstat(src_fd).st_size)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    
+    if not copied:
+        shutil.copyfile(source, destination)
+    
+    if preserve_metadata:
+        shutil.copystat(source, destination)
+    
+    return destination
+
+
 def copy_file_safe(source: str, destination: str) -> bool:
     """
     Copia un archivo de forma segura, creando directorios si es necesario.
@@ -455,15 +759,61 @@ def copy_file_safe(source: str, destination: str) -> bool:
         # Crear directorio destino si no existe
         Path(destination).parent.mkdir(parents=True, exist_ok=True)
         
-        shutil.copy2(source, destination)
+        fast_copy(source, destination, preserve_metadata=True)
         return True
     except Exception as e:
         print(f"Error copiando archivo: {e}")
         return False
 
 
+# PIDs de abridores lanzados por open_in_desktop pendientes de recoger
+_SPAWNED_OPENERS: List[int] = []
+
+
+def _reap_openers() -> None:
+    """Recoge sin bloquear los abridores que ya terminaron (evita zombis)."""
+    for pid in _SPAWNED_OPENERS[:]:
+        try:
+            finished, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            finished = pid
+        if finished:
+            _SPAWNED_OPENERS.remove(pid)
+
+
+def open_in_desktop(path: str) -> None:
+    """
+    Abre un archivo o directorio con la aplicación asociada del sistema.
+    
+    No espera al proceso: en Windows usa os.startfile y en macOS/Linux lanza
+    'open'/'xdg-open' con posix_spawnp, sin la sobrecarga de subprocess.
+    
+    Args:
+        path: Archivo o directorio a abrir
+    """
+    if os.name == 'nt':  # Windows
+        os.startfile(path)
+        return
+    
+    _reap_openers()
+    opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+    pid = os.posix_spawnp(
+        opener,
+        [opener, str(path)],
+        os.environ,
+        file_actions=[
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ],
+        setsid=True
+    )
+    _SPAWNED_OPENERS.append(pid)
+
+
 # Constantes útiles para la aplicación
-CATEGORIAS_INSUMOS = [
+# Tuplas para el orden de presentación (strings internados) y frozensets
+# para comprobar pertenencia en O(1)
+CATEGORIAS_INSUMOS = tuple(sys.intern(s) for s in (
     "Papelería",
     "Tecnología",
     "Limpieza",
@@ -471,9 +821,10 @@ CATEGORIAS_INSUMOS = [
     "Seguridad",
     "Cocina",
     "Otros"
-]
+))
+CATEGORIAS_INSUMOS_SET = frozenset(CATEGORIAS_INSUMOS)
 
-UNIDADES_MEDIDA = [
+UNIDADES_MEDIDA = tuple(sys.intern(s) for s in (
     "Unidad",
     "Caja",
     "Paquete", 
@@ -483,9 +834,10 @@ UNIDADES_MEDIDA = [
     "Bolsa",
     "Rollo",
     "Cartucho"
-]
+))
+UNIDADES_MEDIDA_SET = frozenset(UNIDADES_MEDIDA)
 
-DEPARTAMENTOS = [
+DEPARTAMENTOS = tuple(sys.intern(s) for s in (
     "Delegados Departamentales",
     "Archivos Central",
     "Talento Humanos",
@@ -504,8 +856,25 @@ DEPARTAMENTOS = [
     "Bienestar",
     "Registraduria Municipales",
     "Nómina"
+))
+DEPARTAMENTOS_SET = frozenset(DEPARTAMENTOS)
+
+# Generador propio para IDs (no comparte estado con el módulo random global)
+_ID_RNG = random.Random()
+
+# Año actual memorizado: [valor, instante monotónico de expiración]
+_YEAR_CACHE = [0, 0.0]
+_YEAR_CACHE_TTL = 60.0
+
+
+def _current_year() -> int:
+    """Año actual, recalculado como máximo una vez por minuto"""
+    now = time.monotonic()
+    if now > _YEAR_CACHE[1]:
+        _YEAR_CACHE[0] = datetime.now().year
+        _YEAR_CACHE[1] = now + _YEAR_CACHE_TTL
+    return _YEAR_CACHE[0]
 
-]
 
 def generar_id(prefijo: str, include_year: bool = True) -> str:
     """
@@ -526,6 +895,5 @@ def generar_id(prefijo: str, include_year: bool = True) -> str:
         - EMP-REG-5729 (include_year=False)
         - ENT-9134 (include_year=False)
     """
-    year = datetime.now().year
-    numero = random.randint(1000, 9999)
-    return f"{prefijo}-{year}-{numero}" if include_year else f"{prefijo}-{numero}"
\ No newline at end of file
+    numero = _ID_RNG.randrange(1000, 10000)
+    return f"{prefijo}-{_current_year()}-{numero}" if include_year else f"{prefijo}-{numero}"
\ No newline at end of file
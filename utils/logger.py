@@ -3,15 +3,76 @@ DelegInsumos - Sistema de Logging Centralizado
 Maneja el registro de eventos, errores y operaciones del sistema
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from config.config_manager import config
 
+try:
+    import msgpack
+except ImportError:  # Formato binario opcional
+    msgpack = None
+
+
+class _BytesRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler que escribe registros ya codificados en un archivo binario.
+    
+    Cada registro se formatea y codifica una sola vez: el handler estándar lo
+    formatea dos veces (para medir la rotación y para escribirlo) y además
+    consulta el sistema de archivos en cada registro.
+    """
+    
+    def __init__(self, filename: str, maxBytes: int = 0, backupCount: int = 0,
+                 delay: bool = False):
+        super().__init__(filename, mode='ab', maxBytes=maxBytes,
+                         backupCount=backupCount, delay=True)
+        # RotatingFileHandler fuerza el modo texto 'a' (y su encoding) cuando
+        # hay rotación; la codificación la hace _encode
+        self.mode = 'ab'
+        self.encoding = None
+        if not delay:
+            self.stream = self._open()
+    
+    def _encode(self, record: logging.LogRecord) -> bytes:
+        """Serializa un registro como línea de texto UTF-8"""
+        return self.format(record).encode('utf-8') + b'\n'
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            data = self._encode(record)
+            if self.stream is None:  # delay=True o recién rotado
+                self.stream = self._open()
+            if self.maxBytes > 0 and self.stream.tell() + len(data) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(data)
+            self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _MsgpackRotatingFileHandler(_BytesRotatingFileHandler):
+    """Variante que guarda cada registro como tupla msgpack en lugar de texto"""
+    
+    def _encode(self, record: logging.LogRecord) -> bytes:
+        return msgpack.packb((
+            record.created,
+            record.name,
+            record.levelname,
+            record.getMessage()
+        ))
+
 
 class DelegInsumosLogger:
     """
@@ -21,6 +82,12 @@ class DelegInsumosLogger:
     
     _loggers = {}
     
+    # Los loggers solo encolan registros; un QueueListener (hilo propio)
+    # los escribe en archivo/consola, así el hilo de Tk no hace E/S de disco
+    _log_queue = queue.SimpleQueue()
+    _listener: Optional[logging.handlers.QueueListener] = None
+    _listener_lock = threading.Lock()
+    
     @classmethod
     def get_logger(cls, name: str = 'deleginsumos') -> logging.Logger:
         """
@@ -32,10 +99,12 @@ class DelegInsumosLogger:
         Returns:
             Instancia de logger configurado
         """
-        if name not in cls._loggers:
-            cls._loggers[name] = cls._create_logger(name)
-        
-        return cls._loggers[name]
+        try:
+            return cls._loggers[name]
+        except KeyError:
+            logger = cls._create_logger(name)
+            cls._loggers[name] = logger
+            return logger
     
     @classmethod
     def _create_logger(cls, name: str) -> logging.Logger:
@@ -51,36 +120,61 @@ class DelegInsumosLogger:
         if logger.handlers:
             return logger
         
-        # Configurar formato
-        formatter = logging.Formatter(
-            log_config.get('formato', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'),
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        # Handler para archivo
-        log_file = log_config.get('archivo', './logs/deleginsumos.log')
-        cls._ensure_log_directory(log_file)
-        
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=log_config.get('max_tamaño_mb', 10) * 1024 * 1024,  # MB a bytes
-            backupCount=log_config.get('cantidad_respaldos', 5),
-            encoding='utf-8'
-        )
-        file_handler.setFormatter(formatter)
-        file_handler.setLevel(logging.DEBUG)
-        
-        # Handler para consola (solo errores críticos)
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        console_handler.setLevel(logging.ERROR)
-        
-        # Agregar handlers al logger
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        cls._ensure_listener(log_config)
+        logger.addHandler(logging.handlers.QueueHandler(cls._log_queue))
         
         return logger
     
+    @classmethod
+    def _ensure_listener(cls, log_config: dict) -> None:
+        """Crea (una sola vez) los handlers reales y el hilo que los atiende"""
+        if cls._listener is not None:
+            return
+        
+        with cls._listener_lock:
+            if cls._listener is not None:
+                return
+            
+            # Configurar formato
+            formatter = logging.Formatter(
+                log_config.get('formato', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'),
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
+            
+            # Handler para archivo (se abre recién en la primera escritura)
+            log_file = log_config.get('archivo', './logs/deleginsumos.log')
+            cls._ensure_log_directory(log_file)
+            
+            # 'formato_archivo': 'binario' guarda registros msgpack (si está instalado)
+            handler_class = _BytesRotatingFileHandler
+            if log_config.get('formato_archivo') == 'binario' and msgpack is not None:
+                handler_class = _MsgpackRotatingFileHandler
+            
+            file_handler = handler_class(
+                log_file,
+                maxBytes=log_config.get('max_tamaño_mb', 10) * 1024 * 1024,  # MB a bytes
+                backupCount=log_config.get('cantidad_respaldos', 5),
+                delay=True
+            )
+            file_handler.setFormatter(formatter)
+            file_handler.setLevel(logging.DEBUG)
+            
+            # Handler para consola (solo errores críticos)
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(formatter)
+            console_handler.setLevel(logging.ERROR)
+            
+            listener = logging.handlers.QueueListener(
+                cls._log_queue,
+                file_handler,
+                console_handler,
+                respect_handler_level=True
+            )
+            listener.start()
+            # Vaciar la cola antes de salir
+            atexit.register(listener.stop)
+            cls._listener = listener
+    
     @classmethod
     def _ensure_log_directory(cls, log_file_path: str) -> None:
         """Crea el directorio de logs si no existe"""
@@ -96,10 +190,17 @@ class LoggerMixin:
     @property
     def logger(self) -> logging.Logger:
         """Obtiene el logger para la clase actual"""
-        if not hasattr(self, '_logger'):
+        try:
+            return self._logger
+        except AttributeError:
             class_name = self.__class__.__name__.lower()
             self._logger = DelegInsumosLogger.get_logger(f'deleginsumos.{class_name}')
-        return self._logger
+            return self._logger
+
+
+# Loggers de las funciones de auditoría más frecuentes (resueltos una sola vez)
+_DB_LOGGER = DelegInsumosLogger.get_logger('deleginsumos.database')
+_UI_LOGGER = DelegInsumosLogger.get_logger('deleginsumos.ui')
 
 
 def log_operation(operation_name: str, details: str = "", level: str = "INFO"):
@@ -112,14 +213,17 @@ def log_operation(operation_name: str, details: str = "", level: str = "INFO"):
         level: Nivel de log (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
     logger = DelegInsumosLogger.get_logger()
+    
+    # No construir el mensaje si el nivel está deshabilitado
+    if not logger.isEnabledFor(getattr(logging, level.upper(), logging.INFO)):
+        return
+    
     log_method = getattr(logger, level.lower())
     
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    message = f"OPERACIÓN: {operation_name}"
     if details:
-        message += f" | DETALLES: {details}"
-    
-    log_method(message)
+        log_method("OPERACIÓN: %s | DETALLES: %s", operation_name, details)
+    else:
+        log_method("OPERACIÓN: %s", operation_name)
 
 
 def log_database_operation(operation: str, table: str, record_id: Optional[str] = None, 
@@ -133,15 +237,22 @@ def log_database_operation(operation: str, table: str, record_id: Optional[str]
         record_id: ID del registro (opcional)
         changes: Diccionario con los cambios realizados (opcional)
     """
-    logger = DelegInsumosLogger.get_logger('deleginsumos.database')
+    logger = _DB_LOGGER
     
-    details = f"Tabla: {table}"
+    # No construir el mensaje (ni el repr de changes) si INFO está deshabilitado
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    msg = "DB_%s: Tabla: %s"
+    args = [operation, table]
     if record_id:
-        details += f" | ID: {record_id}"
+        msg += " | ID: %s"
+        args.append(record_id)
     if changes:
-        details += f" | Cambios: {changes}"
+        msg += " | Cambios: %s"
+        args.append(changes)
     
-    logger.info(f"DB_{operation}: {details}")
+    logger.info(msg, *args)
 
 
 def log_user_action(action: str, component: str, details: Optional[str] = None):
@@ -153,13 +264,17 @@ def log_user_action(action: str, component: str, details: Optional[str] = None):
         component: Componente de la UI
         details: Detalles adicionales (opcional)
     """
-    logger = DelegInsumosLogger.get_logger('deleginsumos.ui')
+    logger = _UI_LOGGER
     
-    message = f"ACCIÓN_USUARIO: {action} en {component}"
-    if details:
-        message += f" | {details}"
+    # No construir el mensaje si el nivel INFO está deshabilitado
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
-    logger.info(message)
+    # El handler solo encola el registro (QueueListener): no hay E/S aquí
+    if details:
+        logger.info("ACCIÓN_USUARIO: %s en %s | %s", action, component, details)
+    else:
+        logger.info("ACCIÓN_USUARIO: %s en %s", action, component)
 
 
 def log_error(error_type: str, message: str, component: str, 
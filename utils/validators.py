@@ -4,137 +4,445 @@ Valida la entrada de datos para garantizar integridad y seguridad
 """
 
 import re
-from typing import Any, Optional, List, Dict
+from typing import Any, Callable, Collection, Optional, List, Dict
 from datetime import datetime, date
 from decimal import Decimal, InvalidOperation
 
 from exceptions.custom_exceptions import ValidationException
 
+try:
+    import re2 as _re_engine  # google-re2 opcional: coincidencia en tiempo lineal
+except ImportError:
+    _re_engine = re
 
-class DataValidator:
-    """Validador centralizado de datos del sistema"""
+
+def _trie_pattern(words: List[str]) -> str:
+    """
+    Construye una alternación regex con los prefijos comunes factorizados.
     
-    # Patrones regex para validación
-    EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-    PHONE_PATTERN = re.compile(r'^\+?[\d\s\-\(\)]{7,15}$')  
-    CEDULA_PATTERN = re.compile(r'^\d{6,12}$')  # Cédula colombiana básica
-    NAME_PATTERN = re.compile(r'^[a-zA-ZáéíóúüñÁÉÍÓÚÜÑ\s]{1,150}$')
+    Las palabras se insertan en un trie y se emite un grupo por nodo, de modo
+    que 'DROP'/'DELETE' quedan como D(?:ELETE|ROP) y los tokens de un solo
+    carácter se agrupan en una clase [...]: el motor descarta cada posición
+    con una sola comparación en lugar de probar cada alternativa.
     
-    # Caracteres peligrosos para prevenir inyecciones
-    DANGEROUS_CHARS = ['<', '>', '"', "'", '\\', ';', '--', '/*', '*/', 'DROP', 'DELETE']
+    Args:
+        words: Palabras a reconocer (literales, sin sintaxis regex)
+        
+    Returns:
+        Patrón regex equivalente a la alternación de todas las palabras
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}  # Fin de palabra
+    return _trie_node_pattern(trie)
+
+
+def _trie_node_pattern(node: Dict[str, dict]) -> str:
+    """Emite el patrón de un nodo del trie (ver _trie_pattern)."""
+    branches = []
+    singles = []
+    for char in sorted(key for key in node if key):
+        child = node[char]
+        if len(child) == 1 and '' in child:
+            singles.append(re.escape(char))
+        else:
+            branches.append(re.escape(char) + _trie_node_pattern(child))
+    
+    if singles:
+        branches.append(singles[0] if len(singles) == 1 else f"[{''.join(singles)}]")
+    if not branches:
+        return ''
+    
+    # 'atomic': el patrón ya es un solo átomo (carácter, clase o grupo)
+    if len(branches) > 1:
+        pattern, atomic = f"(?:{'|'.join(branches)})", True
+    else:
+        pattern, atomic = branches[0], bool(singles)
+    
+    # La palabra puede terminar en este nodo: el resto es opcional
+    if '' in node:
+        pattern = (pattern if atomic else f"(?:{pattern})") + '?'
+    return pattern
+
+
+# Valores considerados vacíos (tupla: admite también valores no hashables)
+_EMPTY_VALUES = (None, "")
+
+
+def _is_empty_optional(value: Any, field_name: str, required: bool) -> bool:
+    """
+    Preludio común de los validadores.
     
-    @staticmethod
-    def validate_required(value: Any, field_name: str) -> Any:
-        """
-        Valida que un campo requerido no esté vacío.
+    Returns:
+        True si el valor está vacío y el campo es opcional (el validador
+        devuelve entonces su valor por defecto)
         
-        Args:
-            value: Valor a validar
-            field_name: Nombre del campo para el mensaje de error
-            
-        Returns:
-            Valor validado
-            
-        Raises:
-            ValidationException: Si el valor está vacío
-        """
-        if value is None or value == "":
+    Raises:
+        ValidationException: Si el campo es obligatorio y está vacío
+    """
+    if value in _EMPTY_VALUES:
+        if required:
             raise ValidationException(field_name, "Este campo es obligatorio")
+        return True
+    
+    if required and isinstance(value, str) and value.isspace():
+        raise ValidationException(field_name, "Este campo no puede estar vacío")
+    return False
+
+
+# Patrones regex para validación. El de email (solo clases ASCII, sin
+# retroceso posible en RE2) usa re2 si está instalado; el resto depende de
+# \d/\s Unicode, que RE2 interpreta solo como ASCII, y se queda en re
+_EMAIL_PATTERN = _re_engine.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_PATTERN = re.compile(r'^\+?[\d\s\-\(\)]{7,15}$')  
+_CEDULA_PATTERN = re.compile(r'^\d{6,12}$')  # Cédula colombiana básica
+_NAME_PATTERN = re.compile(r'^[a-zA-ZáéíóúüñÁÉÍÓÚÜÑ\s]{1,150}$')
+
+# PHONE_PATTERN/CEDULA_PATTERN se exponen en DataValidator como referencia; las
+# validaciones usan comprobaciones equivalentes sin el motor de regex.
+# Tabla que elimina los caracteres ASCII admitidos en un teléfono
+_PHONE_ASCII_TABLE = str.maketrans('', '', '0123456789 \t\n\r\f\v-()')
+
+# Caracteres peligrosos para prevenir inyecciones
+_DANGEROUS_CHARS = ['<', '>', '"', "'", '\\', ';', '--', '/*', '*/', 'DROP', 'DELETE']
+# Todos los tokens anteriores en una sola alternación con prefijos
+# compartidos (una pasada por string)
+_DANGEROUS_RE = re.compile(_trie_pattern(_DANGEROUS_CHARS))
+# Primer carácter de cada token: prefiltro barato antes de la regex
+_DANGEROUS_FIRST_CHARS = frozenset(token[0] for token in _DANGEROUS_CHARS)
+
+
+# Validadores sin estado: funciones de módulo que se llaman entre sí
+# directamente (sin búsqueda en la clase); DataValidator los expone como API
+
+
+def _validate_required(value: Any, field_name: str) -> Any:
+    """
+    Valida que un campo requerido no esté vacío.
+    
+    Args:
+        value: Valor a validar
+        field_name: Nombre del campo para el mensaje de error
         
-        if isinstance(value, str) and value.strip() == "":
-            raise ValidationException(field_name, "Este campo no puede estar vacío")
-            
-        return value
+    Returns:
+        Valor validado
+        
+    Raises:
+        ValidationException: Si el valor está vacío
+    """
+    if value in _EMPTY_VALUES:
+        raise ValidationException(field_name, "Este campo es obligatorio")
     
-    @staticmethod
-    def validate_string(value: Any, field_name: str, min_length: int = 0, 
-                       max_length: int = 255, required: bool = True) -> str:
-        """
-        Valida un campo de texto.
+    if isinstance(value, str) and value.isspace():
+        raise ValidationException(field_name, "Este campo no puede estar vacío")
         
-        Args:
-            value: Valor a validar
-            field_name: Nombre del campo
-            min_length: Longitud mínima
-            max_length: Longitud máxima
-            required: Si el campo es obligatorio
-            
-        Returns:
-            String validado y sanitizado
-            
-        Raises:
-            ValidationException: Si la validación falla
-        """
-        if required:
-            DataValidator.validate_required(value, field_name)
-        elif value is None or value == "":
-            return ""
+    return value
+
+
+def _validate_string(value: Any, field_name: str, min_length: int = 0, 
+                    max_length: int = 255, required: bool = True) -> str:
+    """
+    Valida un campo de texto.
+    
+    Args:
+        value: Valor a validar
+        field_name: Nombre del campo
+        min_length: Longitud mínima
+        max_length: Longitud máxima
+        required: Si el campo es obligatorio
         
-        if not isinstance(value, str):
-            value = str(value)
+    Returns:
+        String validado y sanitizado
         
-        # Sanitizar caracteres peligrosos
-        value = DataValidator.sanitize_string(value)
+    Raises:
+        ValidationException: Si la validación falla
+    """
+    if _is_empty_optional(value, field_name, required):
+        return ""
+    
+    if not isinstance(value, str):
+        value = str(value)
+    
+    # Sanitizar caracteres peligrosos
+    value = _sanitize_string(value)
+    
+    # Validar longitud
+    length = len(value)
+    if length < min_length:
+        raise ValidationException(
+            field_name, 
+            f"Debe tener al menos {min_length} caracteres"
+        )
+    
+    if length > max_length:
+        raise ValidationException(
+            field_name, 
+            f"No debe exceder {max_length} caracteres"
+        )
+    
+    return value.strip()
+
+
+def _validate_integer(value: Any, field_name: str, min_val: Optional[int] = None, 
+                     max_val: Optional[int] = None, required: bool = True) -> int:
+    """
+    Valida un campo numérico entero.
+    
+    Args:
+        value: Valor a validar
+        field_name: Nombre del campo
+        min_val: Valor mínimo permitido
+        max_val: Valor máximo permitido
+        required: Si el campo es obligatorio
         
-        # Validar longitud
-        if len(value) < min_length:
-            raise ValidationException(
-                field_name, 
-                f"Debe tener al menos {min_length} caracteres"
-            )
+    Returns:
+        Entero validado
         
-        if len(value) > max_length:
-            raise ValidationException(
-                field_name, 
-                f"No debe exceder {max_length} caracteres"
-            )
+    Raises:
+        ValidationException: Si la validación falla
+    """
+    if _is_empty_optional(value, field_name, required):
+        return 0
+    
+    # Un int ya validado pasa directo; int() ignora por sí mismo los espacios
+    # alrededor de un string, así que no hace falta strip()
+    try:
+        int_value = value if type(value) is int else int(value)
+    except (ValueError, TypeError):
+        raise ValidationException(field_name, "Debe ser un número entero válido")
+    
+    if min_val is not None and int_value < min_val:
+        raise ValidationException(
+            field_name, 
+            f"Debe ser mayor o igual a {min_val}"
+        )
+    
+    if max_val is not None and int_value > max_val:
+        raise ValidationException(
+            field_name, 
+            f"Debe ser menor o igual a {max_val}"
+        )
+    
+    return int_value
+
+
+def _validate_email(value: Any, field_name: str, required: bool = False) -> str:
+    """
+    Valida un campo de email.
+    
+    Args:
+        value: Valor a validar
+        field_name: Nombre del campo
+        required: Si el campo es obligatorio
         
-        return value.strip()
+    Returns:
+        Email validado
+        
+    Raises:
+        ValidationException: Si la validación falla
+    """
+    if _is_empty_optional(value, field_name, required):
+        return ""
+    
+    email = str(value).strip().lower()
     
-    @staticmethod
-    def validate_integer(value: Any, field_name: str, min_val: Optional[int] = None, 
-                        max_val: Optional[int] = None, required: bool = True) -> int:
-        """
-        Valida un campo numérico entero.
+    if not _EMAIL_PATTERN.match(email):
+        raise ValidationException(field_name, "Formato de email inválido")
+    
+    return email
+
+
+def _validate_phone(value: Any, field_name: str, required: bool = False) -> str:
+    """
+    Valida un campo de teléfono.
+    
+    Args:
+        value: Valor a validar
+        field_name: Nombre del campo
+        required: Si el campo es obligatorio
         
-        Args:
-            value: Valor a validar
-            field_name: Nombre del campo
-            min_val: Valor mínimo permitido
-            max_val: Valor máximo permitido
-            required: Si el campo es obligatorio
-            
-        Returns:
-            Entero validado
-            
-        Raises:
-            ValidationException: Si la validación falla
-        """
-        if required:
-            DataValidator.validate_required(value, field_name)
-        elif value is None or value == "":
-            return 0
+    Returns:
+        Teléfono validado
         
-        try:
-            if isinstance(value, str):
-                value = value.strip()
-            int_value = int(value)
-        except (ValueError, TypeError):
-            raise ValidationException(field_name, "Debe ser un número entero válido")
+    Raises:
+        ValidationException: Si la validación falla
+    """
+    if _is_empty_optional(value, field_name, required):
+        return ""
+    
+    phone = str(value).strip()
+    
+    # Equivale a PHONE_PATTERN: '+' opcional y 7-15 dígitos/espacios/-/()
+    body = phone[1:] if phone[:1] == '+' else phone
+    rest = body.translate(_PHONE_ASCII_TABLE)
+    if not 7 <= len(body) <= 15 or (
+        rest and not all(char.isdecimal() or char.isspace() for char in rest)
+    ):
+        raise ValidationException(field_name, "Formato de teléfono inválido")
+    
+    return phone
+
+
+def _validate_cedula(value: Any, field_name: str, required: bool = True) -> str:
+    """
+    Valida un número de cédula colombiana.
+    
+    Args:
+        value: Valor a validar
+        field_name: Nombre del campo
+        required: Si el campo es obligatorio
         
-        if min_val is not None and int_value < min_val:
-            raise ValidationException(
-                field_name, 
-                f"Debe ser mayor o igual a {min_val}"
-            )
+    Returns:
+        Cédula validada
         
-        if max_val is not None and int_value > max_val:
-            raise ValidationException(
-                field_name, 
-                f"Debe ser menor o igual a {max_val}"
-            )
+    Raises:
+        ValidationException: Si la validación falla
+    """
+    if _is_empty_optional(value, field_name, required):
+        return ""
+    
+    cedula = str(value).strip()
+    
+    # Equivale a CEDULA_PATTERN (\d es isdecimal, no isdigit)
+    if not (6 <= len(cedula) <= 12 and cedula.isdecimal()):
+        raise ValidationException(
+            field_name, 
+            "La cédula debe contener entre 6 y 12 dígitos"
+        )
+    
+    return cedula
+
+
+def _validate_date(value: Any, field_name: str, required: bool = False) -> Optional[date]:
+    """
+    Valida un campo de fecha.
+    
+    Args:
+        value: Valor a validar (string, datetime, date)
+        field_name: Nombre del campo
+        required: Si el campo es obligatorio
+        
+    Returns:
+        Fecha validada
+        
+    Raises:
+        ValidationException: Si la validación falla
+    """
+    if _is_empty_optional(value, field_name, required):
+        return None
+    
+    if isinstance(value, date):
+        return value
+    
+    if isinstance(value, datetime):
+        return value.date()
+    
+    # Intentar parsear string
+    try:
+        if isinstance(value, str):
+            value = value.strip()
+            # Formato esperado: YYYY-MM-DD. El caso canónico (ASCII, con ceros)
+            # se arma directamente; strptime queda para variantes como 2024-1-5
+            if (len(value) == 10 and value[4] == '-' and value[7] == '-'
+                    and value.isascii() and value[:4].isdigit()
+                    and value[5:7].isdigit() and value[8:].isdigit()):
+                return date(int(value[:4]), int(value[5:7]), int(value[8:]))
+            return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        pass
+    
+    raise ValidationException(field_name, "Formato de fecha inválido (use YYYY-MM-DD)")
+
+
+def _validate_choice(value: Any, field_name: str, choices: Collection[str], 
+                    required: bool = True) -> str:
+    """
+    Valida que un valor esté dentro de opciones permitidas.
+    
+    Args:
+        value: Valor a validar
+        field_name: Nombre del campo
+        choices: Opciones válidas; una lista conserva su orden en el mensaje
+            de error y un frozenset precalculado (p. ej. los *_SET de
+            utils.helpers) permite comprobar la pertenencia en O(1)
+        required: Si el campo es obligatorio
         
-        return int_value
+    Returns:
+        Valor validado
+        
+    Raises:
+        ValidationException: Si la validación falla
+    """
+    if _is_empty_optional(value, field_name, required):
+        return ""
+    
+    str_value = str(value).strip()
+    
+    if str_value not in choices:
+        # Los conjuntos no tienen orden: se listan ordenados para un mensaje estable
+        options = choices if isinstance(choices, (list, tuple)) else sorted(choices)
+        raise ValidationException(
+            field_name, 
+            f"Debe ser uno de: {', '.join(options)}"
+        )
+    
+    return str_value
+
+
+def _sanitize_string(value: str) -> str:
+    """
+    Sanitiza un string removiendo caracteres peligrosos.
+    
+    Args:
+        value: String a sanitizar
+        
+    Returns:
+        String sanitizado
+    """
+    if not isinstance(value, str):
+        return str(value)
+    
+    # Sin ningún carácter inicial de token no puede haber coincidencias:
+    # se devuelve el mismo string sin pasar por el motor de regex
+    if _DANGEROUS_FIRST_CHARS.isdisjoint(value):
+        return value
+    
+    # Remover caracteres peligrosos. Quitar un token puede unir otro
+    # (p. ej. '-<-' -> '--'), así que se repite hasta que no quede ninguno;
+    # en el caso habitual basta una sola pasada
+    sanitized, removed = _DANGEROUS_RE.subn("", value)
+    while removed:
+        sanitized, removed = _DANGEROUS_RE.subn("", sanitized)
+    
+    return sanitized
+
+
+class DataValidator:
+    """Validador centralizado de datos del sistema"""
+    
+    # Patrones regex para validación
+    EMAIL_PATTERN = _EMAIL_PATTERN
+    PHONE_PATTERN = _PHONE_PATTERN
+    CEDULA_PATTERN = _CEDULA_PATTERN
+    NAME_PATTERN = _NAME_PATTERN
+    
+    # Caracteres peligrosos para prevenir inyecciones
+    DANGEROUS_CHARS = _DANGEROUS_CHARS
+    DANGEROUS_PATTERN = _DANGEROUS_RE
+    
+    # Validadores (funciones de módulo expuestas como métodos estáticos)
+    validate_required = staticmethod(_validate_required)
+    validate_string = staticmethod(_validate_string)
+    validate_integer = staticmethod(_validate_integer)
+    validate_email = staticmethod(_validate_email)
+    validate_phone = staticmethod(_validate_phone)
+    validate_cedula = staticmethod(_validate_cedula)
+    validate_date = staticmethod(_validate_date)
+    validate_choice = staticmethod(_validate_choice)
+    sanitize_string = staticmethod(_sanitize_string)
     
     """@staticmethod
     def validate_decimal(value: Any, field_name: str, min_val: Optional[float] = None, 
@@ -189,189 +497,153 @@ class DataValidator:
             )
         
         return decimal_value.quantize(Decimal('0.01'))  # Redondear a 2 decimales"""
+
+
+# Funciones de conveniencia para validaciones comunes
+
+# Especificación por entidad: (campo, valor por defecto, validador, kwargs)
+_INSUMO_FIELDS = (
+    ('nombre', None, _validate_string, {'min_length': 1, 'max_length': 100}),
+    ('categoria', None, _validate_string, {'min_length': 1, 'max_length': 50}),
+    ('cantidad_actual', 0, _validate_integer, {'min_val': 0}),
+    ('cantidad_minima', 5, _validate_integer, {'min_val': 0}),
+    ('cantidad_maxima', 100, _validate_integer, {'min_val': 1}),
+    ('unidad_medida', 'unidad', _validate_string, {'max_length': 20}),
+    ('proveedor', '', _validate_string, {'max_length': 100, 'required': False}),
+)
+
+_EMPLEADO_FIELDS = (
+    ('nombre_completo', None, _validate_string, {'min_length': 2, 'max_length': 150}),
+    ('cargo', '', _validate_string, {'max_length': 100, 'required': False}),
+    ('departamento', '', _validate_string, {'max_length': 100, 'required': False}),
+    ('cedula', None, _validate_cedula, {}),
+    ('email', '', _validate_email, {'required': False}),
+    ('telefono', '', _validate_phone, {'required': False}),
+    ('fecha_ingreso', None, _validate_date, {'required': False}),
+)
+
+_ENTREGA_FIELDS = (
+    ('empleado_id', None, _validate_integer, {'min_val': 1}),
+    ('insumo_id', None, _validate_integer, {'min_val': 1}),
+    ('cantidad', None, _validate_integer, {'min_val': 1}),
+    ('observaciones', '', _validate_string, {'max_length': 500, 'required': False}),
+    ('entregado_por', '', _validate_string, {'max_length': 100, 'required': False}),
+)
+
+
+def _validate_fields(data: Dict[str, Any], fields: tuple) -> Dict[str, Any]:
+    """
+    Aplica una especificación de campos en orden (el primer error se propaga).
     
-    @staticmethod
-    def validate_email(value: Any, field_name: str, required: bool = False) -> str:
-        """
-        Valida un campo de email.
-        
-        Args:
-            value: Valor a validar
-            field_name: Nombre del campo
-            required: Si el campo es obligatorio
-            
-        Returns:
-            Email validado
-            
-        Raises:
-            ValidationException: Si la validación falla
-        """
-        if required:
-            DataValidator.validate_required(value, field_name)
-        elif value is None or value == "":
-            return ""
-        
-        email = str(value).strip().lower()
-        
-        if not DataValidator.EMAIL_PATTERN.match(email):
-            raise ValidationException(field_name, "Formato de email inválido")
-        
-        return email
+    Es la referencia interpretada de _compile_entity_validator; las pruebas de
+    integración comparan ambas para que no diverjan.
+    """
+    return {
+        key: validator(data.get(key, default), key, **kwargs)
+        for key, default, validator, kwargs in fields
+    }
+
+
+def _emit_prelude(lines: List[str], var: str, key: str, required: bool,
+                  empty_result: str) -> str:
+    """
+    Emite el preludio de _is_empty_optional para un campo.
     
-    @staticmethod
-    def validate_phone(value: Any, field_name: str, required: bool = False) -> str:
-        """
-        Valida un campo de teléfono.
-        
-        Args:
-            value: Valor a validar
-            field_name: Nombre del campo
-            required: Si el campo es obligatorio
-            
-        Returns:
-            Teléfono validado
-            
-        Raises:
-            ValidationException: Si la validación falla
-        """
-        if required:
-            DataValidator.validate_required(value, field_name)
-        elif value is None or value == "":
-            return ""
-        
-        phone = str(value).strip()
-        
-        if not DataValidator.PHONE_PATTERN.match(phone):
-            raise ValidationException(field_name, "Formato de teléfono inválido")
-        
-        return phone
+    Returns:
+        Indentación del cuerpo que sigue (dentro del else si es opcional)
+    """
+    if required:
+        lines.append(f"    if {var} in _EMPTY_VALUES:")
+        lines.append(f"        raise ValidationException({key!r}, 'Este campo es obligatorio')")
+        lines.append(f"    if isinstance({var}, str) and {var}.isspace():")
+        lines.append(f"        raise ValidationException({key!r}, 'Este campo no puede estar vacío')")
+        return "    "
+    lines.append(f"    if {var} in _EMPTY_VALUES:")
+    lines.append(f"        {var} = {empty_result}")
+    lines.append("    else:")
+    return "        "
+
+
+def _compile_entity_validator(fields: tuple, name: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Genera una función especializada para una especificación de campos.
     
-    @staticmethod
-    def validate_cedula(value: Any, field_name: str, required: bool = True) -> str:
-        """
-        Valida un número de cédula colombiana.
-        
-        Args:
-            value: Valor a validar
-            field_name: Nombre del campo
-            required: Si el campo es obligatorio
-            
-        Returns:
-            Cédula validada
-            
-        Raises:
-            ValidationException: Si la validación falla
-        """
-        if required:
-            DataValidator.validate_required(value, field_name)
-        elif value is None or value == "":
-            return ""
-        
-        cedula = str(value).strip()
-        
-        if not DataValidator.CEDULA_PATTERN.match(cedula):
-            raise ValidationException(
-                field_name, 
-                "La cédula debe contener entre 6 y 12 dígitos"
-            )
-        
-        return cedula
+    Equivale a _validate_fields(data, fields), pero con los límites de
+    _validate_string/_validate_integer escritos como literales en línea (sin
+    ramas "is not None" ni dict de kwargs por campo); el resto de validadores
+    se llaman directamente con sus argumentos fijos.
     
-    @staticmethod
-    def validate_date(value: Any, field_name: str, required: bool = False) -> Optional[date]:
-        """
-        Valida un campo de fecha.
-        
-        Args:
-            value: Valor a validar (string, datetime, date)
-            field_name: Nombre del campo
-            required: Si el campo es obligatorio
-            
-        Returns:
-            Fecha validada
-            
-        Raises:
-            ValidationException: Si la validación falla
-        """
-        if required:
-            DataValidator.validate_required(value, field_name)
-        elif value is None or value == "":
-            return None
-        
-        if isinstance(value, date):
-            return value
-        
-        if isinstance(value, datetime):
-            return value.date()
-        
-        # Intentar parsear string
-        try:
-            if isinstance(value, str):
-                value = value.strip()
-                # Formato esperado: YYYY-MM-DD
-                return datetime.strptime(value, "%Y-%m-%d").date()
-        except ValueError:
-            pass
+    Args:
+        fields: Especificación (clave, por defecto, validador, kwargs)
+        name: Nombre de la función generada (para trazas)
         
-        raise ValidationException(field_name, "Formato de fecha inválido (use YYYY-MM-DD)")
+    Returns:
+        Función data -> dict validado
+    """
+    namespace = {
+        '_EMPTY_VALUES': _EMPTY_VALUES,
+        'ValidationException': ValidationException,
+        '_sanitize_string': _sanitize_string,
+    }
+    lines = [f"def {name}(data):", "    get = data.get"]
+    result_vars = []
     
-    @staticmethod
-    def validate_choice(value: Any, field_name: str, choices: List[str], 
-                       required: bool = True) -> str:
-        """
-        Valida que un valor esté dentro de opciones permitidas.
-        
-        Args:
-            value: Valor a validar
-            field_name: Nombre del campo
-            choices: Lista de opciones válidas
-            required: Si el campo es obligatorio
-            
-        Returns:
-            Valor validado
-            
-        Raises:
-            ValidationException: Si la validación falla
-        """
-        if required:
-            DataValidator.validate_required(value, field_name)
-        elif value is None or value == "":
-            return ""
-        
-        str_value = str(value).strip()
-        
-        if str_value not in choices:
-            raise ValidationException(
-                field_name, 
-                f"Debe ser uno de: {', '.join(choices)}"
-            )
-        
-        return str_value
+    for index, (key, default, validator, kwargs) in enumerate(fields):
+        var = f"v{index}"
+        result_vars.append((key, var))
+        namespace[f"d{index}"] = default
+        lines.append(f"    {var} = get({key!r}, d{index})")
+        
+        if validator is _validate_string:
+            min_length = kwargs.get('min_length', 0)
+            max_length = kwargs.get('max_length', 255)
+            ind = _emit_prelude(lines, var, key, kwargs.get('required', True), "''")
+            lines.append(f"{ind}if not isinstance({var}, str):")
+            lines.append(f"{ind}    {var} = str({var})")
+            lines.append(f"{ind}{var} = _sanitize_string({var})")
+            lines.append(f"{ind}n = len({var})")
+            if min_length > 0:
+                message = f"Debe tener al menos {min_length} caracteres"
+                lines.append(f"{ind}if n < {min_length!r}:")
+                lines.append(f"{ind}    raise ValidationException({key!r}, {message!r})")
+            message = f"No debe exceder {max_length} caracteres"
+            lines.append(f"{ind}if n > {max_length!r}:")
+            lines.append(f"{ind}    raise ValidationException({key!r}, {message!r})")
+            lines.append(f"{ind}{var} = {var}.strip()")
+        elif validator is _validate_integer:
+            min_val = kwargs.get('min_val')
+            max_val = kwargs.get('max_val')
+            ind = _emit_prelude(lines, var, key, kwargs.get('required', True), "0")
+            lines.append(f"{ind}if type({var}) is not int:")
+            lines.append(f"{ind}    try:")
+            lines.append(f"{ind}        {var} = int({var})")
+            lines.append(f"{ind}    except (ValueError, TypeError):")
+            lines.append(f"{ind}        raise ValidationException({key!r}, 'Debe ser un número entero válido')")
+            if min_val is not None:
+                message = f"Debe ser mayor o igual a {min_val}"
+                lines.append(f"{ind}if {var} < {min_val!r}:")
+                lines.append(f"{ind}    raise ValidationException({key!r}, {message!r})")
+            if max_val is not None:
+                message = f"Debe ser menor o igual a {max_val}"
+                lines.append(f"{ind}if {var} > {max_val!r}:")
+                lines.append(f"{ind}    raise ValidationException({key!r}, {message!r})")
+        else:
+            namespace[f"f{index}"] = validator
+            args = "".join(f", {arg}={val!r}" for arg, val in kwargs.items())
+            lines.append(f"    {var} = f{index}({var}, {key!r}{args})")
     
-    @staticmethod
-    def sanitize_string(value: str) -> str:
-        """
-        Sanitiza un string removiendo caracteres peligrosos.
-        
-        Args:
-            value: String a sanitizar
-            
-        Returns:
-            String sanitizado
-        """
-        if not isinstance(value, str):
-            return str(value)
-        
-        sanitized = value
-        
-        # Remover caracteres peligrosos
-        for char in DataValidator.DANGEROUS_CHARS:
-            sanitized = sanitized.replace(char, "")
-        
-        return sanitized
+    items = ", ".join(f"{key!r}: {var}" for key, var in result_vars)
+    lines.append(f"    return {{{items}}}")
+    
+    exec(compile("\n".join(lines), f"<{name}>", "exec"), namespace)
+    return namespace[name]
 
 
-# Funciones de conveniencia para validaciones comunes
+# Validadores especializados, generados una sola vez al importar el módulo
+_validate_insumo_fields = _compile_entity_validator(_INSUMO_FIELDS, "_validate_insumo_fields")
+_validate_empleado_fields = _compile_entity_validator(_EMPLEADO_FIELDS, "_validate_empleado_fields")
+_validate_entrega_fields = _compile_entity_validator(_ENTREGA_FIELDS, "_validate_entrega_fields")
+
 
 def validate_insumo_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -386,31 +658,7 @@ def validate_insumo_data(data: Dict[str, Any]) -> Dict[str, Any]:
     Raises:
         ValidationException: Si algún campo no es válido
     """
-    validator = DataValidator()
-    
-    return {
-        'nombre': validator.validate_string(
-            data.get('nombre'), 'nombre', min_length=1, max_length=100
-        ),
-        'categoria': validator.validate_string(
-            data.get('categoria'), 'categoria', min_length=1, max_length=50
-        ),
-        'cantidad_actual': validator.validate_integer(
-            data.get('cantidad_actual', 0), 'cantidad_actual', min_val=0
-        ),
-        'cantidad_minima': validator.validate_integer(
-            data.get('cantidad_minima', 5), 'cantidad_minima', min_val=0
-        ),
-        'cantidad_maxima': validator.validate_integer(
-            data.get('cantidad_maxima', 100), 'cantidad_maxima', min_val=1
-        ),
-        'unidad_medida': validator.validate_string(
-            data.get('unidad_medida', 'unidad'), 'unidad_medida', max_length=20
-        ),
-        'proveedor': validator.validate_string(
-            data.get('proveedor', ''), 'proveedor', max_length=100, required=False
-        )
-    }
+    return _validate_insumo_fields(data)
 
 
 def validate_empleado_data(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -426,31 +674,7 @@ def validate_empleado_data(data: Dict[str, Any]) -> Dict[str, Any]:
     Raises:
         ValidationException: Si algún campo no es válido
     """
-    validator = DataValidator()
-    
-    return {
-        'nombre_completo': validator.validate_string(
-            data.get('nombre_completo'), 'nombre_completo', min_length=2, max_length=150
-        ),
-        'cargo': validator.validate_string(
-            data.get('cargo', ''), 'cargo', max_length=100, required=False
-        ),
-        'departamento': validator.validate_string(
-            data.get('departamento', ''), 'departamento', max_length=100, required=False
-        ),
-        'cedula': validator.validate_cedula(
-            data.get('cedula'), 'cedula'
-        ),
-        'email': validator.validate_email(
-            data.get('email', ''), 'email', required=False
-        ),
-        'telefono': validator.validate_phone(
-            data.get('telefono', ''), 'telefono', required=False
-        ),
-        'fecha_ingreso': validator.validate_date(
-            data.get('fecha_ingreso'), 'fecha_ingreso', required=False
-        )
-    }
+    return _validate_empleado_fields(data)
 
 
 def validate_entrega_data(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -466,22 +690,4 @@ def validate_entrega_data(data: Dict[str, Any]) -> Dict[str, Any]:
     Raises:
         ValidationException: Si algún campo no es válido
     """
-    validator = DataValidator()
-    
-    return {
-        'empleado_id': validator.validate_integer(
-            data.get('empleado_id'), 'empleado_id', min_val=1
-        ),
-        'insumo_id': validator.validate_integer(
-            data.get('insumo_id'), 'insumo_id', min_val=1
-        ),
-        'cantidad': validator.validate_integer(
-            data.get('cantidad'), 'cantidad', min_val=1
-        ),
-        'observaciones': validator.validate_string(
-            data.get('observaciones', ''), 'observaciones', max_length=500, required=False
-        ),
-        'entregado_por': validator.validate_string(
-            data.get('entregado_por', ''), 'entregado_por', max_length=100, required=False
-        )
-    }
\ No newline at end of file
+    return _validate_entrega_fields(data)